@@ -5,33 +5,74 @@ Compiles the NVIDIA GPU Monitor server into a standalone executable
 """
 
 import os
+import re
 import sys
 import subprocess
 import tempfile
+import argparse
 import shutil
+import stat
+import hashlib
+import logging
+import platform
+import importlib.util
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Persistent pip cache so repeated builds skip re-downloading wheels
+PIP_CACHE_DIR = Path(os.environ.get("PIP_CACHE_DIR") or Path(tempfile.gettempdir()) / "rtxss_pip_cache")
+
+# Places in rtxss.py where the subprocess patch can be inserted, matched in one pass
+PATCH_MARKERS = re.compile(rb"# Configure enhanced logging|class RTSSDataCollector|class NvidiaDataCollector|logging\.basicConfig")
+# First non-blank line that is not an import or a comment
+FIRST_CODE_LINE = re.compile(rb"^(?!import |from |#)(?=.*\S)", re.MULTILINE)
+
+# Distribution name at the start of a requirement string such as "flask>=2.2.0"
+REQUIREMENT_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+# Bump whenever the icon drawing in create_icon changes
+ICON_VERSION = "v1"
+ICON_PATH = "rtxss_icon.ico"
+
+# Build log goes to stdout as "[LEVEL] message"; set RTXSS_BUILD_LOG_LEVEL=ERROR for quieter runs
+logging.basicConfig(
+    level=os.environ.get("RTXSS_BUILD_LOG_LEVEL", "INFO").upper(),
+    format="[%(levelname)s] %(message)s",
+    stream=sys.stdout
+)
+logger = logging.getLogger(__name__)
+
 def log_info(message):
     """Log information with timestamp"""
-    print(f"[INFO] {message}")
+    logger.info(message)
 
 def log_error(message):
     """Log error with timestamp"""
-    print(f"[ERROR] {message}")
+    logger.error(message)
 
-def run_command(command, check=True):
+def run_command(command, check=True, env=None):
     """Run a command and return the result"""
     log_info(f"Running: {' '.join(command) if isinstance(command, list) else command}")
-    try:
-        result = subprocess.run(command, shell=True, check=check, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        return result
-    except subprocess.CalledProcessError as e:
+    # Only go through the shell for string commands; argv lists are executed directly
+    shell = isinstance(command, str)
+    kwargs = {}
+    if platform.system() == 'Windows':
+        kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+    # Stream output line by line instead of buffering it all in memory;
+    # children never get the console's stdin
+    with subprocess.Popen(command, shell=shell, stdin=subprocess.DEVNULL,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1, env=env, **kwargs) as proc:
+        for line in proc.stdout:
+            print(line, end='')
+        returncode = proc.wait()
+    
+    if check and returncode != 0:
+        e = subprocess.CalledProcessError(returncode, command)
         log_error(f"Command failed: {e}")
-        if e.stderr:
-            print(e.stderr)
-        raise
+        raise e
+    return subprocess.CompletedProcess(command, returncode)
 
 def check_running_processes():
     """Check if rtxss.exe is currently running"""
@@ -41,7 +82,7 @@ def check_running_processes():
         import psutil
         running_processes = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'exe']):
+        for proc in psutil.process_iter(['name']):
             try:
                 if proc.info['name'] and 'rtxss' in proc.info['name'].lower():
                     running_processes.append(proc)
@@ -111,29 +152,108 @@ def install_build_dependencies():
     
     build_deps = [
         "pyinstaller>=5.0",
-        "flask>=2.0.0",
-        "flask-socketio>=5.0.0", 
-        "psutil>=5.8.0",
+        "flask>=2.2.0",
+        "flask-socketio>=5.1.0", 
+        "psutil>=6.0.0",
+        "nvidia-ml-py>=12.0.0",
         "pystray>=0.19.0",
         "pillow>=9.0.0",
         "python-socketio>=5.0.0",
-        "python-engineio>=4.0.0"
+        "python-engineio>=4.0.0",
+        "simple-websocket>=0.10.0",
+        "orjson>=3.9.0"
     ]
     
+    PIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Skip installation if this exact dependency set was already installed into this environment;
+    # sys.prefix keeps separate venvs on the same Python version from sharing a stamp
+    key = hashlib.sha256(("\n".join(build_deps) + sys.version + sys.prefix).encode()).hexdigest()
+    stamp = PIP_CACHE_DIR / f"installed_{key}.stamp"
+    if stamp.exists():
+        log_info("Build deps already satisfied (cache hit)")
+        return True
+
+    pip_env = dict(os.environ, PIP_CACHE_DIR=str(PIP_CACHE_DIR))
+    pip_install = [
+        sys.executable, "-m", "pip", "install",
+        "--disable-pip-version-check",
+        "--prefer-binary",
+        "--no-input",
+        "--no-compile",
+        "--quiet",
+        "--progress-bar", "off",
+        "--cache-dir", str(PIP_CACHE_DIR)
+    ]
+
+    try:
+        # Install everything in one resolver pass
+        run_command(pip_install + build_deps, env=pip_env)
+        compile_installed_packages(build_deps)
+        stamp.touch()
+        return True
+    except Exception as e:
+        log_error(f"Batched install failed: {e}")
+
+    # Fall back to one package at a time to report which one failed
     for dep in build_deps:
         try:
             log_info(f"Installing {dep}")
-            run_command([sys.executable, "-m", "pip", "install", dep])
+            run_command(pip_install + [dep], env=pip_env)
         except Exception as e:
             log_error(f"Failed to install {dep}: {e}")
             return False
-    
+
+    compile_installed_packages(build_deps)
+    stamp.touch()
     return True
 
+def installed_distributions(requirements):
+    """Resolve requirement strings to installed distributions, following their dependencies"""
+    importlib.invalidate_caches()
+    found = {}
+    pending = [REQUIREMENT_NAME.match(req).group(0) for req in requirements]
+    while pending:
+        name = re.sub(r"[-_.]+", "-", pending.pop()).lower()
+        if name in found:
+            continue
+        try:
+            dist = importlib.metadata.distribution(name)
+        except importlib.metadata.PackageNotFoundError:
+            continue  # e.g. a platform-specific dependency not installed here
+        found[name] = dist
+        for req in dist.requires or []:
+            if "extra ==" not in req:
+                pending.append(REQUIREMENT_NAME.match(req).group(0))
+    return list(found.values())
+
+def compile_installed_packages(requirements):
+    """Byte-compile just the packages pip installed with --no-compile, in parallel"""
+    targets = set()
+    for dist in installed_distributions(requirements):
+        for file in dist.files or []:
+            # Top-level package dirs (or single modules) inside site-packages; skip scripts outside it
+            if file.suffix == ".py" and file.parts[0] != "..":
+                targets.add(str(dist.locate_file(file.parts[0])))
+    
+    if not targets:
+        return
+    log_info(f"Byte-compiling {len(targets)} installed packages")
+    # -j 0 uses one worker per CPU; failures here only cost import speed, not correctness
+    run_command([sys.executable, "-m", "compileall", "-j", "0", "-q"] + sorted(targets), check=False)
+
 def create_icon():
     """Create a simple icon for the executable"""
     log_info("Creating application icon...")
     
+    # Reuse the icon from a previous build if it was drawn by the same version
+    version_file = ICON_PATH + ".ver"
+    if os.path.exists(ICON_PATH) and os.path.exists(version_file):
+        with open(version_file, 'r') as f:
+            if f.read().strip() == ICON_VERSION:
+                log_info(f"Icon up to date: {ICON_PATH}")
+                return ICON_PATH
+    
     try:
         from PIL import Image, ImageDraw
         
@@ -177,15 +297,20 @@ def create_icon():
         draw.text((text_x, text_y), text, fill='white', font=font)
         
         # Save as ICO
-        icon_path = "rtxss_icon.ico"
+        icon_path = ICON_PATH
         # Convert to appropriate sizes for ICO
         sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-        images = []
-        for icon_size in sizes:
-            resized = image.resize(icon_size, Image.Resampling.LANCZOS)
-            images.append(resized)
+        # Downscale largest-first, each step from the previous (larger) output
+        resized_by_size = {}
+        source = image
+        for icon_size in sorted(sizes, reverse=True):
+            source = source.resize(icon_size, Image.Resampling.LANCZOS) if source.size != icon_size else source
+            resized_by_size[icon_size] = source
+        images = [resized_by_size[icon_size] for icon_size in sizes]
         
         images[0].save(icon_path, format='ICO', sizes=[(img.size[0], img.size[1]) for img in images], append_images=images[1:])
+        with open(version_file, 'w') as f:
+            f.write(ICON_VERSION)
         log_info(f"Icon created: {icon_path}")
         return icon_path
         
@@ -197,22 +322,31 @@ def create_patched_script(main_script):
     """Create a patched version of the script for compilation"""
     log_info("Creating patched script for Windows compilation...")
     
-    # Read the original script
-    with open(main_script, 'r', encoding='utf-8') as f:
+    # Read the original script as bytes; all markers are ASCII so no decoding is needed
+    with open(main_script, 'rb') as f:
         content = f.read()
     
+    # Reuse the previous patched script if the source hasn't changed
+    patched_script = 'rtxss-compiled.py'
+    hash_file = patched_script + '.md5'
+    source_hash = hashlib.md5(content).hexdigest()
+    if os.path.exists(patched_script) and os.path.exists(hash_file):
+        with open(hash_file, 'r') as f:
+            if f.read().strip() == source_hash:
+                log_info(f"Patched script up to date: {patched_script}")
+                return patched_script
+    
     # Find a good insertion point after imports but before classes
-    insertion_point = content.find('# Configure enhanced logging')
-    if insertion_point == -1:
-        insertion_point = content.find('class RTSSDataCollector')
-    if insertion_point == -1:
-        insertion_point = content.find('class NvidiaDataCollector')
+    match = PATCH_MARKERS.search(content)
+    insertion_point = match.start() if match else -1
+    
     if insertion_point == -1:
-        insertion_point = content.find('logging.basicConfig')
+        # Fallback: insert after the leading import/comment block
+        match = FIRST_CODE_LINE.search(content)
+        insertion_point = match.start() if match else 0
     
-    if insertion_point != -1:
-        # Insert the subprocess patch before the main code
-        subprocess_patch = '''
+    # Insert the subprocess patch before the main code
+    subprocess_patch = b'''
 # Windows subprocess patches to hide console windows
 import platform
 if platform.system() == 'Windows':
@@ -235,53 +369,25 @@ if platform.system() == 'Windows':
     subprocess.Popen = _patched_popen
 
 '''
-        # Insert the patch at the found position
-        content = content[:insertion_point] + subprocess_patch + content[insertion_point:]
-    else:
-        # Fallback: append to the beginning after imports
-        lines = content.split('\n')
-        import_end = 0
-        for i, line in enumerate(lines):
-            if line.strip() and not (line.startswith('import ') or line.startswith('from ') or line.startswith('#')):
-                import_end = i
-                break
-        
-        patch_lines = [
-            '',
-            '# Windows subprocess patches to hide console windows',
-            'import platform',
-            'if platform.system() == "Windows":',
-            '    import subprocess',
-            '    _original_run = subprocess.run',
-            '    def _patched_run(*args, **kwargs):',
-            '        if "creationflags" not in kwargs:',
-            '            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW',
-            '        return _original_run(*args, **kwargs)',
-            '    subprocess.run = _patched_run',
-            '    _original_popen = subprocess.Popen',
-            '    def _patched_popen(*args, **kwargs):',
-            '        if "creationflags" not in kwargs:',
-            '            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW',
-            '        return _original_popen(*args, **kwargs)',
-            '    subprocess.Popen = _patched_popen',
-            ''
-        ]
-        
-        lines = lines[:import_end] + patch_lines + lines[import_end:]
-        content = '\n'.join(lines)
+    content = content[:insertion_point] + subprocess_patch + content[insertion_point:]
     
     # Write patched script
-    patched_script = 'rtxss-compiled.py'
-    with open(patched_script, 'w', encoding='utf-8') as f:
+    with open(patched_script, 'wb') as f:
         f.write(content)
+    with open(hash_file, 'w') as f:
+        f.write(source_hash)
     
     log_info(f"Patched script created: {patched_script}")
     return patched_script
 
-def create_spec_file(main_script, icon_path=None):
+def create_spec_file(main_script, icon_path=None, use_upx=False):
     """Create PyInstaller spec file for customization"""
     log_info("Creating PyInstaller spec file...")
     
+    # UPX slows both the build and every launch, so it is opt-in.
+    # The runtime DLLs gain little from it and are always left uncompressed.
+    upx_exclude = ['vcruntime140.dll', 'python3*.dll'] if use_upx else []
+    
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
 import sys
@@ -292,13 +398,15 @@ block_cipher = None
 # Add hidden imports for modules that PyInstaller might miss
 hidden_imports = [
     'engineio.async_drivers.threading',
+    'simple_websocket',
     'socketio',
     'flask_socketio',
     'dns',
     'dns.resolver',
     'dns.asyncresolver',
     'psutil._psutil_windows',
-    'PIL._tkinter_finder',
+    'pynvml',
+    'orjson',
     'queue',
     'winreg',
     'platform'
@@ -324,7 +432,19 @@ a = Analysis(
         'pytest',
         'setuptools',
         'unittest',
-        'test'
+        'test',
+        # Pillow GUI bridges (the tray icon does not use Qt or Tk)
+        'PIL.ImageQt',
+        'PIL.ImageTk',
+        'PIL._tkinter_finder',
+        # Stdlib modules nothing in the app imports
+        # (http.server stays: Werkzeug's dev server is built on it)
+        'pydoc_data',
+        'xmlrpc',
+        'distutils',
+        'lib2to3',
+        'pickletools',
+        'doctest'
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -334,19 +454,19 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-folder build: binaries and data are collected next to the exe
+# instead of being unpacked to a temp dir on every launch
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='rtxss',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
+    upx={use_upx},
+    upx_exclude={upx_exclude!r},
     runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
@@ -357,6 +477,17 @@ exe = EXE(
     uac_admin=False,
     {'icon=["' + icon_path + '"],' if icon_path else ''}
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx={use_upx},
+    upx_exclude={upx_exclude!r},
+    name='rtxss',
+)
 '''
     
     with open('rtxss.spec', 'w') as f:
@@ -364,39 +495,64 @@ exe = EXE(
     
     return 'rtxss.spec'
 
-def compile_executable(main_script):
-    """Compile the Python script into a standalone executable"""
-    log_info("Compiling executable...")
+def prepare_build(main_script):
+    """Install build dependencies while creating the patched script and icon"""
+    log_info("Preparing build inputs...")
     
-    # Create patched script for Windows subprocess handling
-    patched_script = create_patched_script(main_script)
+    # The icon needs Pillow, which may only become available once the deps are installed
+    pillow_ready = importlib.util.find_spec("PIL") is not None
     
-    # Create icon
-    icon_path = create_icon()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        deps_future = executor.submit(install_build_dependencies)
+        patched_future = executor.submit(create_patched_script, main_script)
+        icon_future = executor.submit(create_icon) if pillow_ready else None
+        
+        deps_ok = deps_future.result()
+        patched_script = patched_future.result()
+        icon_path = icon_future.result() if icon_future else None
+    
+    if not deps_ok:
+        return None
+    
+    if not pillow_ready:
+        icon_path = create_icon()
+    
+    return patched_script, icon_path
+
+def compile_executable(patched_script, icon_path=None, use_upx=False):
+    """Compile the Python script into a standalone executable"""
+    log_info("Compiling executable...")
     
     # Create spec file for better control
-    spec_file = create_spec_file(patched_script, icon_path)
+    spec_file = create_spec_file(patched_script, icon_path, use_upx)
     
     # Build command
+    # -O makes PyInstaller embed optimized bytecode; note this strips assert statements
     build_cmd = [
-        sys.executable, "-m", "PyInstaller",
+        sys.executable, "-O", "-m", "PyInstaller",
         "--clean",
         "--noconfirm",
         spec_file
     ]
+    build_env = dict(os.environ, PYTHONOPTIMIZE="1")
     
     try:
         # Run PyInstaller
-        result = run_command(build_cmd)
+        result = run_command(build_cmd, env=build_env)
         
         # Check if executable was created
-        exe_path = Path("dist") / "rtxss.exe"
+        dist_dir = Path("dist") / "rtxss"
+        exe_path = dist_dir / "rtxss.exe"
         if exe_path.exists():
             log_info(f"Executable created successfully: {exe_path}")
             
-            # Get file size
-            size_mb = exe_path.stat().st_size / (1024 * 1024)
-            log_info(f"Executable size: {size_mb:.1f} MB")
+            # Get total size of the application folder
+            size_mb = sum(f.stat().st_size for f in dist_dir.rglob('*') if f.is_file()) / (1024 * 1024)
+            log_info(f"Application folder size: {size_mb:.1f} MB")
+            
+            # Zip the folder for distribution
+            archive = shutil.make_archive(str(dist_dir), 'zip', root_dir="dist", base_dir="rtxss")
+            log_info(f"Distribution archive: {archive}")
             
             return str(exe_path)
         else:
@@ -407,6 +563,21 @@ def compile_executable(main_script):
         log_error(f"Compilation failed: {e}")
         return None
 
+def remove_readonly(func, path, exc_info):
+    """shutil.rmtree error handler that clears the read-only bit and retries"""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+def remove_tree(path):
+    """Remove a directory tree, using the native rmdir on Windows"""
+    if platform.system() == 'Windows':
+        # rmdir /s /q removes large trees like build/ much faster than a Python walk
+        result = subprocess.run(["cmd", "/c", "rmdir", "/s", "/q", str(path)],
+                                creationflags=subprocess.CREATE_NO_WINDOW)
+        if result.returncode == 0 and not path.exists():
+            return
+    shutil.rmtree(path, onerror=remove_readonly)
+
 def cleanup_build_files():
     """Clean up temporary build files"""
     log_info("Cleaning up build files...")
@@ -416,19 +587,35 @@ def cleanup_build_files():
         "__pycache__",
         "rtxss.spec",
         "rtxss_icon.ico",
-        "rtxss-compiled.py"
+        "rtxss_icon.ico.ver",
+        "rtxss-compiled.py",
+        "rtxss-compiled.py.md5"
     ]
     
     for item in cleanup_items:
-        if os.path.exists(item):
-            if os.path.isdir(item):
-                shutil.rmtree(item)
-            else:
-                os.remove(item)
-            log_info(f"Removed: {item}")
+        path = Path(item)
+        # A single stat tells us both whether it exists and what kind it is
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            remove_tree(path)
+        else:
+            path.unlink()
+        log_info(f"Removed: {item}")
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Compile RTXSS into a standalone executable")
+    parser.add_argument("--upx", action="store_true",
+                        help="compress binaries with UPX (smaller output, slower build and startup)")
+    return parser.parse_args()
 
 def main():
     """Main compilation process"""
+    args = parse_args()
+    
     print("=" * 60)
     print("RTXSS (RTX System Stats) Compiler")
     print("=" * 60)
@@ -450,13 +637,14 @@ def main():
             log_error("Dependency check failed")
             return 1
         
-        # Step 3: Install build dependencies
-        if not install_build_dependencies():
+        # Step 3: Install build dependencies, patched script and icon in parallel
+        build_inputs = prepare_build(main_script)
+        if not build_inputs:
             log_error("Failed to install build dependencies")
             return 1
         
         # Step 4: Compile executable
-        exe_path = compile_executable(main_script)
+        exe_path = compile_executable(*build_inputs, use_upx=args.upx)
         if not exe_path:
             log_error("Compilation failed")
             return 1
@@ -466,8 +654,8 @@ def main():
         print("COMPILATION SUCCESSFUL!")
         print("=" * 60)
         log_info(f"Executable: {exe_path}")
-        log_info("The executable is completely standalone and includes all dependencies")
-        log_info("You can distribute this single file without any additional requirements")
+        log_info("The dist/rtxss folder is completely standalone and includes all dependencies")
+        log_info("Distribute the whole folder (or dist/rtxss.zip) without any additional requirements")
         log_info("Settings and logs will be saved in the same folder as the executable")
         
         # Optional cleanup
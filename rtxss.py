@@ -2,19 +2,36 @@ import sys
 import subprocess
 import psutil
 import json
+import csv
+import io
+import re
+import gzip
+import hashlib
 import threading
 import time
 import logging
+import atexit
 import winreg
 from datetime import datetime
-from collections import deque
-from flask import Flask, render_template_string, request, jsonify
-from flask_socketio import SocketIO, emit
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_socketio import SocketIO, emit, join_room
 import pystray
 from PIL import Image, ImageDraw
 import configparser
 import os
 
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure enhanced logging for both console and file
 log_dir = os.path.dirname(os.path.abspath(sys.executable if hasattr(sys, 'frozen') else __file__))
 log_file = os.path.join(log_dir, 'rtxss.log')
@@ -23,11 +40,25 @@ log_file = os.path.join(log_dir, 'rtxss.log')
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 # Setup file handler with rotation
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler
 file_handler = RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=3)
 file_handler.setFormatter(formatter)
 file_handler.setLevel(logging.DEBUG)
 
+# Buffer file writes so routine records don't hit the disk one at a time;
+# warnings and errors still flush the buffer immediately
+buffered_file_handler = MemoryHandler(capacity=512, flushLevel=logging.WARNING, target=file_handler, flushOnClose=True)
+buffered_file_handler.setLevel(logging.DEBUG)
+atexit.register(buffered_file_handler.flush)
+
+def flush_log_periodically(interval=5.0):
+    """Flush buffered log records to disk every few seconds"""
+    while True:
+        time.sleep(interval)
+        buffered_file_handler.flush()
+
+threading.Thread(target=flush_log_periodically, daemon=True).start()
+
 # Setup console handler
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
@@ -36,7 +67,7 @@ console_handler.setLevel(logging.INFO)
 # Configure root logger
 logging.basicConfig(
     level=logging.DEBUG,
-    handlers=[file_handler, console_handler]
+    handlers=[buffered_file_handler, console_handler]
 )
 
 logger = logging.getLogger(__name__)
@@ -51,141 +82,412 @@ logger.info(f"Working directory: {os.getcwd()}")
 logger.info(f"Log file: {log_file}")
 logger.info(f"Running as compiled: {hasattr(sys, 'frozen')}")
 
+# Per-lane transfer rate in GT/s for each PCIe generation
+PCIE_GTS = {1: 2.5, 2: 5.0, 3: 8.0, 4: 16.0, 5: 32.0, 6: 64.0}
+
+# Seconds without a GPU data read before the nvidia-smi stream is paused
+STREAM_IDLE_TIMEOUT = 30
+
+def smi_number(text):
+    """Convert a numeric nvidia-smi CSV field to int/float; placeholders like [N/A] stay text"""
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes REST responses with orjson"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class OrjsonSocketIOJSON:
+    """Stand-in for the json module so python-socketio encodes packets with orjson"""
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # python-socketio passes separators=...; orjson output is already compact
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+class GPUHistory:
+    """Fixed-size ring buffer of chart samples, overwritten in place each tick"""
+    def __init__(self, size=60):
+        self.size = size
+        self.seq = 0
+        self._slots = [None] * size
+        self._idx = 0
+        self._count = 0
+    
+    def append(self, entry):
+        """Store a sample in the next slot with the next sequence number, replacing the oldest once full"""
+        self.seq += 1
+        entry['seq'] = self.seq
+        self._slots[self._idx] = entry
+        self._idx = (self._idx + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+    
+    def entries(self):
+        """Return the stored samples oldest first"""
+        if self._count < self.size:
+            return self._slots[:self._count]
+        return self._slots[self._idx:] + self._slots[:self._idx]
+    
+    def entries_since(self, seq):
+        """Return the samples newer than seq, or None if some were already overwritten or seq is unknown"""
+        entries = self.entries()
+        if seq > self.seq or (entries and entries[0]['seq'] > seq + 1):
+            return None
+        return [entry for entry in entries if entry['seq'] > seq]
+
 class NvidiaDataCollector:
     def __init__(self):
         self.running = False
         self._graphics_warning_logged = False
-        
+        self.update_interval = 1.0
+        
+        # psutil handles and names of GPU processes, keyed by PID
+        self._proc_cache = {}
+        self._proc_names = {}
+        
+        # nvidia-smi stream state, only used when NVML is unavailable
+        self._stream_proc = None
+        self._stream_lock = threading.Lock()
+        # Serializes starting and stopping the stream so concurrent callers can't spawn duplicates
+        self._stream_control_lock = threading.RLock()
+        self._latest = {}
+        self._first_sample = threading.Event()
+        self._last_stream_read = 0.0
+        atexit.register(self.stop_gpu_stream)
+        
+        # Name, driver, CUDA version, memory size and max PCIe link per GPU index, read once
+        self._static_gpu_info = None
+        
+        self._nvml_handles = self.init_nvml()
+        
+        # Long-lived nvidia-smi that keeps the driver initialized between queries
+        self._keepalive_proc = None
+        atexit.register(self.stop_keepalive)
+        self.start_keepalive()
+    
+    def init_nvml(self):
+        """Initialize NVML once and cache a handle per GPU; returns None when unavailable"""
+        if pynvml is None:
+            logger.info("pynvml not installed, using nvidia-smi for GPU data")
+            return None
+        try:
+            pynvml.nvmlInit()
+            atexit.register(pynvml.nvmlShutdown)
+            handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+            logger.info(f"NVML initialized - found {len(handles)} GPU(s)")
+            return handles
+        except pynvml.NVMLError as e:
+            logger.warning(f"NVML initialization failed, using nvidia-smi for GPU data - {str(e)}")
+            return None
+    
     def get_gpu_data(self):
-        """Get GPU information using nvidia-smi queries"""
-        logger.debug("Starting GPU data collection")
+        """Get GPU information via NVML, falling back to nvidia-smi"""
+        if self._nvml_handles is None:
+            return self.get_gpu_data_smi()
+        
         try:
-            cmd = [
-                'nvidia-smi', 
-                '--query-gpu=index,name,driver_version,memory.total,memory.used,memory.free,utilization.gpu,utilization.memory,temperature.gpu,power.draw,power.limit,fan.speed,pcie.link.gen.current,pcie.link.gen.max,pcie.link.width.current,pcie.link.width.max',
-                '--format=csv,noheader,nounits'
-            ]
+            return self.get_gpu_data_nvml()
+        except pynvml.NVMLError as e:
+            logger.error(f"Failed to get GPU data - NVML error - {str(e)}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error getting GPU data - {str(e)}")
+            return []
+    
+    def nvml_optional(self, query, handle):
+        """Run an NVML query some boards don't support (laptop, vGPU), returning 'N/A' instead of raising"""
+        try:
+            return query(handle)
+        except pynvml.NVMLError:
+            return 'N/A'
+    
+    def get_gpu_data_nvml(self):
+        """Get GPU information from the cached NVML handles"""
+        if self._static_gpu_info is None:
+            self._static_gpu_info = self.get_static_gpu_info_nvml()
+        
+        gpu_info = []
+        for index, handle in enumerate(self._nvml_handles):
+            memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+            current_gen = self.nvml_optional(pynvml.nvmlDeviceGetCurrPcieLinkGeneration, handle)
+            # Power readings are in milliwatts
+            power_draw = self.nvml_optional(pynvml.nvmlDeviceGetPowerUsage, handle)
+            power_limit = self.nvml_optional(pynvml.nvmlDeviceGetEnforcedPowerLimit, handle)
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            lines = result.stdout.strip().split('\n')
+            gpu = dict(self._static_gpu_info[index])
+            gpu.update({
+                'memory_used': memory.used // (1024 * 1024),
+                'memory_free': memory.free // (1024 * 1024),
+                'gpu_util': utilization.gpu,
+                'memory_util': utilization.memory,
+                'temperature': pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU),
+                'power_draw': round(power_draw / 1000.0, 2) if power_draw != 'N/A' else power_draw,
+                'power_limit': round(power_limit / 1000.0, 2) if power_limit != 'N/A' else power_limit,
+                # Not every board reports a fan (e.g. passively cooled cards)
+                'fan_speed': self.nvml_optional(pynvml.nvmlDeviceGetFanSpeed, handle),
+                'pcie_gen_current': current_gen,
+                'pcie_width_current': self.nvml_optional(pynvml.nvmlDeviceGetCurrPcieLinkWidth, handle),
+                'pcie_gts_current': PCIE_GTS.get(current_gen, 0.0)
+            })
+            gpu_info.append(gpu)
+        
+        return gpu_info
+    
+    def get_static_gpu_info_nvml(self):
+        """Read the fields that never change at runtime once per GPU via NVML"""
+        driver_version = pynvml.nvmlSystemGetDriverVersion()
+        
+        cuda_version = "N/A"
+        try:
+            cuda = pynvml.nvmlSystemGetCudaDriverVersion()
+            cuda_version = f"{cuda // 1000}.{(cuda % 1000) // 10}"
+        except pynvml.NVMLError as e:
+            logger.warning(f"Failed to get CUDA version - {str(e)}")
+        
+        static_info = {}
+        for index, handle in enumerate(self._nvml_handles):
+            max_gen = self.nvml_optional(pynvml.nvmlDeviceGetMaxPcieLinkGeneration, handle)
+            static_info[index] = {
+                'index': index,
+                'name': pynvml.nvmlDeviceGetName(handle),
+                'driver_version': driver_version,
+                'memory_total': pynvml.nvmlDeviceGetMemoryInfo(handle).total // (1024 * 1024),
+                'pcie_gen_max': max_gen,
+                'pcie_width_max': self.nvml_optional(pynvml.nvmlDeviceGetMaxPcieLinkWidth, handle),
+                'pcie_gts_max': PCIE_GTS.get(max_gen, 0.0),
+                'cuda_version': cuda_version
+            }
+        return static_info
+    
+    def get_gpu_data_smi(self):
+        """Get the latest GPU information streamed by nvidia-smi"""
+        with self._stream_control_lock:
+            self._last_stream_read = time.monotonic()
+            if self._stream_proc is None or self._stream_proc.poll() is not None:
+                self.stop_gpu_stream()  # drops samples left by a stream that exited on its own
+                self.start_gpu_stream()
+        
+        # Give a freshly started stream a moment to deliver its first sample
+        if not self._latest:
+            self._first_sample.wait(timeout=5)
+        
+        with self._stream_lock:
+            return [self._latest[index] for index in sorted(self._latest)]
+    
+    def set_update_interval(self, interval):
+        """Change the sampling interval (seconds), restarting the nvidia-smi stream if needed"""
+        with self._stream_control_lock:
+            if interval == self.update_interval:
+                return
+            self.update_interval = interval
+            if self._stream_proc is not None and self._stream_proc.poll() is None:
+                self.stop_gpu_stream()
+                self.start_gpu_stream()
+    
+    def start_gpu_stream(self):
+        """Spawn one long-running nvidia-smi that prints a sample every update interval"""
+        with self._stream_control_lock:
+            if self._stream_proc is not None and self._stream_proc.poll() is None:
+                return
             
-            # Get CUDA version
-            cuda_version = "N/A"
-            try:
-                cuda_cmd = ['nvidia-smi', '--query-gpu=cuda_version', '--format=csv,noheader,nounits']
-                cuda_result = subprocess.run(cuda_cmd, capture_output=True, text=True, check=False)
-                if cuda_result.returncode == 0 and cuda_result.stdout.strip():
-                    cuda_version = cuda_result.stdout.strip().split('\n')[0]
-                else:
-                    # Fallback: try to get CUDA version from nvidia-smi output
-                    version_cmd = ['nvidia-smi']
-                    version_result = subprocess.run(version_cmd, capture_output=True, text=True, check=False)
-                    if version_result.returncode == 0:
-                        for line in version_result.stdout.split('\n'):
-                            if 'CUDA Version:' in line:
-                                cuda_version = line.split('CUDA Version:')[1].strip().split()[0]
-                                break
-            except Exception as e:
-                logger.warning(f"Failed to get CUDA version - {str(e)}")
+            if not self._static_gpu_info:
+                self._static_gpu_info = self.get_static_gpu_info_smi()
             
-            gpu_info = []
-            for line in lines:
-                if line.strip():
-                    parts = [part.strip() for part in line.split(',')]
-                    if len(parts) >= 16:
-                        # Calculate GT/s based on PCIe generation
-                        def get_gts(gen):
-                            gen_map = {'1': 2.5, '2': 5.0, '3': 8.0, '4': 16.0, '5': 32.0, '6': 64.0}
-                            return gen_map.get(str(gen).strip(), 0.0)
-                        
-                        current_gen = parts[12].strip()
-                        max_gen = parts[13].strip()
-                        current_width = parts[14].strip()
-                        max_width = parts[15].strip()
-                        
-                        gpu_info.append({
-                            'index': parts[0],
-                            'name': parts[1],
-                            'driver_version': parts[2],
-                            'memory_total': parts[3],
-                            'memory_used': parts[4],
-                            'memory_free': parts[5],
-                            'gpu_util': parts[6],
-                            'memory_util': parts[7],
-                            'temperature': parts[8],
-                            'power_draw': parts[9],
-                            'power_limit': parts[10],
-                            'fan_speed': parts[11],
-                            'pcie_gen_current': current_gen,
-                            'pcie_gen_max': max_gen,
-                            'pcie_width_current': current_width,
-                            'pcie_width_max': max_width,
-                            'pcie_gts_current': get_gts(current_gen),
-                            'pcie_gts_max': get_gts(max_gen),
-                            'cuda_version': cuda_version
-                        })
+            # Only fields that change at runtime are streamed; the rest come from get_static_gpu_info_smi
+            cmd = [
+                'nvidia-smi',
+                '--query-gpu=index,memory.used,memory.free,utilization.gpu,utilization.memory,temperature.gpu,power.draw,power.limit,fan.speed,pcie.link.gen.current,pcie.link.width.current',
+                '--format=csv,noheader,nounits',
+                f'--loop-ms={int(self.update_interval * 1000)}'
+            ]
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+            except OSError as e:
+                logger.error(f"Failed to start nvidia-smi stream - {str(e)}")
+                return
             
-            logger.debug(f"Successfully collected data for {len(gpu_info)} GPU(s)")
-            return gpu_info
+            self._stream_proc = proc
+            threading.Thread(target=self.read_gpu_stream, args=(proc,), daemon=True).start()
+            logger.info(f"Started nvidia-smi stream (PID {proc.pid}) at {int(self.update_interval * 1000)}ms")
+    
+    def stop_gpu_stream(self):
+        """Terminate the nvidia-smi stream if it is running"""
+        with self._stream_control_lock:
+            proc = self._stream_proc
+            self._stream_proc = None
+            if proc is not None and proc.poll() is None:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
             
+            # Samples from a stopped stream are stale; the next read waits for a fresh one
+            with self._stream_lock:
+                self._latest.clear()
+                self._first_sample.clear()
+    
+    def stop_idle_gpu_stream(self):
+        """Stop the nvidia-smi stream once nothing has read GPU data for STREAM_IDLE_TIMEOUT seconds"""
+        with self._stream_control_lock:
+            if self._stream_proc is None or time.monotonic() - self._last_stream_read < STREAM_IDLE_TIMEOUT:
+                return
+            self.stop_gpu_stream()
+    
+    def start_keepalive(self):
+        """On Windows without NVML, keep an idle nvidia-smi running so each query skips driver init"""
+        if sys.platform != 'win32' or self._nvml_handles is not None:
+            return
+        if self._keepalive_proc is not None and self._keepalive_proc.poll() is None:
+            return
+        try:
+            self._keepalive_proc = subprocess.Popen(['nvidia-smi', '-l', '3600'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            logger.info(f"Started nvidia-smi keep-alive (PID {self._keepalive_proc.pid})")
+        except OSError as e:
+            logger.warning(f"Failed to start nvidia-smi keep-alive - {str(e)}")
+    
+    def stop_keepalive(self):
+        """Terminate the keep-alive nvidia-smi if it is running"""
+        proc = self._keepalive_proc
+        self._keepalive_proc = None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    
+    def read_gpu_stream(self, proc):
+        """Background thread: parse each streamed line into the latest per-GPU sample"""
+        try:
+            for line in proc.stdout:
+                gpu = self.parse_gpu_line(line)
+                if gpu is None:
+                    continue
+                with self._stream_lock:
+                    # Lines still buffered from a stream that was just stopped are dropped
+                    if proc is not self._stream_proc:
+                        break
+                    self._latest[gpu['index']] = gpu
+                    self._first_sample.set()
+        except Exception as e:
+            logger.error(f"Error reading nvidia-smi stream - {str(e)}")
+        
+        if proc is self._stream_proc:
+            logger.warning(f"nvidia-smi stream exited with code {proc.poll()}")
+    
+    def parse_gpu_line(self, line):
+        """Convert one streamed nvidia-smi CSV line into a GPU info dict"""
+        # Every streamed column is numeric, so store native numbers rather than CSV text
+        parts = [smi_number(part) for part in next(csv.reader([line], skipinitialspace=True), [])]
+        if len(parts) < 11:
+            return None
+        
+        current_gen = parts[9]
+        
+        gpu = dict(self._static_gpu_info.get(parts[0], {}))
+        gpu.update({
+            'index': parts[0],
+            'memory_used': parts[1],
+            'memory_free': parts[2],
+            'gpu_util': parts[3],
+            'memory_util': parts[4],
+            'temperature': parts[5],
+            'power_draw': parts[6],
+            'power_limit': parts[7],
+            'fan_speed': parts[8],
+            'pcie_gen_current': current_gen,
+            'pcie_width_current': parts[10],
+            'pcie_gts_current': PCIE_GTS.get(current_gen, 0.0)
+        })
+        return gpu
+    
+    def get_static_gpu_info_smi(self):
+        """Query the fields that never change at runtime once per GPU via nvidia-smi"""
+        cuda_version = self.get_cuda_version_smi()
+        static_info = {}
+        try:
+            cmd = [
+                'nvidia-smi',
+                '--query-gpu=index,name,driver_version,memory.total,pcie.link.gen.max,pcie.link.width.max',
+                '--format=csv,noheader,nounits'
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            for parts in csv.reader(io.StringIO(result.stdout), skipinitialspace=True):
+                if len(parts) >= 6:
+                    index = smi_number(parts[0])
+                    max_gen = smi_number(parts[4])
+                    static_info[index] = {
+                        'index': index,
+                        'name': parts[1],
+                        'driver_version': parts[2],
+                        'memory_total': smi_number(parts[3]),
+                        'pcie_gen_max': max_gen,
+                        'pcie_width_max': smi_number(parts[5]),
+                        'pcie_gts_max': PCIE_GTS.get(max_gen, 0.0),
+                        'cuda_version': cuda_version
+                    }
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get GPU data - nvidia-smi error - {str(e)}")
+            logger.error(f"Failed to get static GPU info - nvidia-smi error - {str(e)}")
             logger.error(f"nvidia-smi stderr - {e.stderr if e.stderr else 'No stderr'}")
-            return []
+        return static_info
+    
+    def get_cuda_version_smi(self):
+        """Get the CUDA version reported by nvidia-smi"""
+        cuda_version = "N/A"
+        try:
+            cuda_cmd = ['nvidia-smi', '--query-gpu=cuda_version', '--format=csv,noheader,nounits']
+            cuda_result = subprocess.run(cuda_cmd, capture_output=True, text=True, check=False)
+            if cuda_result.returncode == 0 and cuda_result.stdout.strip():
+                cuda_version = cuda_result.stdout.strip().split('\n')[0]
+            else:
+                # Fallback: try to get CUDA version from nvidia-smi output
+                version_cmd = ['nvidia-smi']
+                version_result = subprocess.run(version_cmd, capture_output=True, text=True, check=False)
+                if version_result.returncode == 0:
+                    for line in version_result.stdout.split('\n'):
+                        if 'CUDA Version:' in line:
+                            cuda_version = line.split('CUDA Version:')[1].strip().split()[0]
+                            break
         except Exception as e:
-            logger.error(f"Unexpected error getting GPU data - {str(e)}")
-            return []
+            logger.warning(f"Failed to get CUDA version - {str(e)}")
+        return cuda_version
     
     def get_process_data(self):
         """Get process information with CPU and RAM usage"""
         try:
-            nvidia_processes = {}
-            
-            # Get compute processes
-            try:
-                cmd = ['nvidia-smi', '--query-compute-apps=pid,used_memory', '--format=csv,noheader,nounits']
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        parts = line.split(',')
-                        if len(parts) >= 2:
-                            pid = parts[0].strip()
-                            memory = parts[1].strip()
-                            nvidia_processes[pid] = memory
-                            
-            except subprocess.CalledProcessError:
-                pass
-            
-            # Try graphics processes
-            try:
-                cmd = ['nvidia-smi', '--query-graphics-apps=pid,used_memory', '--format=csv,noheader,nounits']
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        parts = line.split(',')
-                        if len(parts) >= 2:
-                            pid = parts[0].strip()
-                            memory = parts[1].strip()
-                            if pid not in nvidia_processes:
-                                nvidia_processes[pid] = memory
-                                
-            except subprocess.CalledProcessError:
-                if not self._graphics_warning_logged:
-                    logger.info("Graphics apps query not supported, using alternative process detection")
-                    self._graphics_warning_logged = True
+            if self._nvml_handles is not None:
+                nvidia_processes = self.get_gpu_processes_nvml()
+            else:
+                nvidia_processes = self.get_gpu_processes_smi()
             
-            # Enrich with process details
+            # Enrich with process details, reusing handles from previous ticks
             process_data = []
+            seen_pids = set()
             for pid_str, gpu_memory in nvidia_processes.items():
                 try:
                     pid = int(pid_str)
-                    process = psutil.Process(pid)
+                    seen_pids.add(pid)
+                    process = self._proc_cache.get(pid)
+                    # is_running() also catches a PID that was reused by a new process
+                    if process is None or not process.is_running():
+                        process = psutil.Process(pid)
+                        self._proc_names[pid] = process.name()
+                        self._proc_cache[pid] = process
                     
                     process_info = {
                         'pid': pid,
-                        'name': process.name(),
+                        'name': self._proc_names[pid],
                         'memory_percent': f"{process.memory_percent():.1f}"
                     }
                     process_data.append(process_info)
@@ -197,29 +499,102 @@ class NvidiaDataCollector:
                         'memory_percent': 'N/A'
                     })
             
+            # Forget processes that no longer use the GPU
+            for pid in list(self._proc_cache):
+                if pid not in seen_pids:
+                    del self._proc_cache[pid]
+                    self._proc_names.pop(pid, None)
+            
             return process_data
             
         except Exception as e:
             logger.error(f"Error getting process data - {str(e)}")
             return []
 
+    def get_gpu_processes_nvml(self):
+        """Map PID to used GPU memory (MB) for compute and graphics processes via NVML"""
+        nvidia_processes = {}
+        for handle in self._nvml_handles:
+            for query in (pynvml.nvmlDeviceGetComputeRunningProcesses, pynvml.nvmlDeviceGetGraphicsRunningProcesses):
+                try:
+                    running = query(handle)
+                except pynvml.NVMLError:
+                    continue
+                for proc in running:
+                    memory = proc.usedGpuMemory // (1024 * 1024) if proc.usedGpuMemory else 'N/A'
+                    nvidia_processes.setdefault(proc.pid, memory)
+        return nvidia_processes
+    
+    def get_gpu_processes_smi(self):
+        """Map PID to used GPU memory (MB) using concurrent nvidia-smi app queries"""
+        # Start both queries before waiting on either so they run side by side
+        queries = []
+        for kind in ('compute', 'graphics'):
+            cmd = ['nvidia-smi', f'--query-{kind}-apps=pid,used_memory', '--format=csv,noheader,nounits']
+            queries.append((kind, subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)))
+        
+        nvidia_processes = {}
+        for kind, proc in queries:
+            stdout, _ = proc.communicate()
+            if proc.returncode != 0:
+                if kind == 'graphics' and not self._graphics_warning_logged:
+                    logger.info("Graphics apps query not supported, using alternative process detection")
+                    self._graphics_warning_logged = True
+                continue
+            
+            # Compute entries come first and take precedence over graphics ones
+            for parts in csv.reader(io.StringIO(stdout), skipinitialspace=True):
+                if len(parts) >= 2:
+                    nvidia_processes.setdefault(parts[0], parts[1])
+        
+        return nvidia_processes
+
+# SocketIO room every dashboard client joins to receive GPU updates
+MONITOR_ROOM = 'monitors'
+
 class NvidiaWebServer:
     def __init__(self):
         logger.info("Initializing NvidiaWebServer...")
         try:
             self.app = Flask(__name__)
             self.app.config['SECRET_KEY'] = 'nvidia_monitor_secret'
+            if orjson is not None:
+                self.app.json = OrjsonProvider(self.app)
             logger.debug("Flask app created successfully")
             
-            self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+            # Threading mode keeps the server compatible with the pystray main loop;
+            # with simple-websocket installed it serves a real WebSocket transport
+            # instead of falling back to HTTP long-polling
+            self.socketio = SocketIO(self.app, async_mode='threading', cors_allowed_origins="*",
+                                     json=OrjsonSocketIOJSON if orjson else json)
             logger.debug("SocketIO initialized successfully")
             
             self.data_collector = NvidiaDataCollector()
-            self.gpu_history = deque(maxlen=60)
+            self.gpu_history = GPUHistory(60)
             self.running = False
+            self.running_idle = False
             self.connected_clients = 0
             self.update_interval = 1.0  # Default 1000ms
             
+            # Process lists change slowly and are expensive to build, so
+            # update_data only refreshes them every process_update_ratio ticks
+            self.process_update_ratio = 5
+            self._last_process_data = None
+            
+            # Process lists are built on a worker thread so nvidia-smi/psutil stalls never delay a GPU tick
+            self._process_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rtxss-processes')
+            self._process_future = None
+            
+            # Most recent data collected by update_data, shared with the REST API
+            self.snapshot_lock = threading.Lock()
+            self.latest_snapshot = None
+            self.latest_snapshot_time = 0.0
+            
+            # Last state broadcast to clients, used to send only what changed
+            self._last_gpu_info = []
+            self._last_processes = None
+            self._send_full = True
+            
             logger.info("Setting up routes...")
             self.setup_routes()
             logger.info("Setting up SocketIO handlers...")
@@ -233,18 +608,27 @@ class NvidiaWebServer:
     def setup_routes(self):
         @self.app.route('/')
         def index():
-            return render_template_string(HTML_TEMPLATE)
+            return asset_response(INDEX_ASSET)
+        
+        @self.app.route('/static/rtxss.css')
+        def dashboard_css():
+            return asset_response(CSS_ASSET)
+        
+        @self.app.route('/static/rtxss.js')
+        def dashboard_js():
+            return asset_response(JS_ASSET)
         
         @self.app.route('/api/gpu_data')
         def get_gpu_data():
-            gpu_data = self.data_collector.get_gpu_data()
-            process_data = self.data_collector.get_process_data()
+            with self.snapshot_lock:
+                snapshot = self.latest_snapshot
+                age = time.monotonic() - self.latest_snapshot_time
             
-            return jsonify({
-                'gpu_info': gpu_data,
-                'processes': process_data,
-                'timestamp': datetime.now().isoformat()
-            })
+            # Serve what the update thread collected; only query the GPU here if that data is stale
+            if snapshot is None or age > 2 * self.update_interval:
+                snapshot = self.collect_snapshot()
+            
+            return jsonify(snapshot)
         
         @self.app.route('/api/set_power', methods=['POST'])
         def set_power_limit():
@@ -264,6 +648,12 @@ class NvidiaWebServer:
             except subprocess.CalledProcessError as e:
                 error_msg = f"Failed to set power limit - {str(e)}"
                 logger.error(error_msg)
+                return jsonify({'success': False, 'message': error_msg})
+            except Exception as e:
+                error_msg = f"Error - {str(e)}"
+                logger.error(error_msg)
+                return jsonify({'success': False, 'message': error_msg})
+        
         @self.app.route('/api/set_update_interval', methods=['POST'])
         def set_update_interval():
             try:
@@ -274,6 +664,7 @@ class NvidiaWebServer:
                     return jsonify({'success': False, 'message': 'Update interval must be between 100ms and 10000ms'})
                 
                 self.update_interval = interval / 1000.0  # Convert to seconds
+                self.data_collector.set_update_interval(self.update_interval)
                 logger.info(f"Update interval set to {interval}ms")
                 return jsonify({'success': True, 'message': f'Update interval set to {interval}ms'})
                 
@@ -281,85 +672,192 @@ class NvidiaWebServer:
                 error_msg = f"Error setting update interval - {str(e)}"
                 logger.error(error_msg)
                 return jsonify({'success': False, 'message': error_msg})
-            except Exception as e:
-                error_msg = f"Error - {str(e)}"
-                logger.error(error_msg)
-                return jsonify({'success': False, 'message': error_msg})
     
     def setup_socketio(self):
         @self.socketio.on('connect')
-        def handle_connect():
+        def handle_connect(auth=None):
             self.connected_clients += 1
+            join_room(MONITOR_ROOM)
             logger.info(f'Client connected - Total clients {self.connected_clients}')
             emit('status', {'message': 'Connected to NVIDIA GPU Monitor'})
+            
+            # A reconnecting client reports the last sample it has; backfill just the
+            # missing ones if the buffer still holds them, otherwise send everything
+            history = None
+            last_seq = auth.get('last_seq') if isinstance(auth, dict) else None
+            if isinstance(last_seq, int) and last_seq > 0:
+                history = self.gpu_history.entries_since(last_seq)
+            
+            # Give the new client the full state once; every tick after this is a delta
+            with self.snapshot_lock:
+                snapshot = self.latest_snapshot
+            emit('history_full', {
+                'history': history if history is not None else self.gpu_history.entries(),
+                'backfill': history is not None,
+                'gpu_info': snapshot['gpu_info'] if snapshot else [],
+                'processes': snapshot['processes'] if snapshot else []
+            })
+            self._send_full = True
         
         @self.socketio.on('disconnect')
         def handle_disconnect():
             self.connected_clients = max(0, self.connected_clients - 1)
             logger.info(f'Client disconnected - Total clients {self.connected_clients}')
     
+    def refresh_process_data(self, wait=True):
+        """Rebuild the cached process list on the worker thread, optionally waiting for it"""
+        future = self._process_future
+        if future is None or future.done():
+            future = self._process_executor.submit(self.data_collector.get_process_data)
+            future.add_done_callback(self.store_process_data)
+            self._process_future = future
+        
+        # Nothing cached yet means there is nothing to show instead, so wait for the first list
+        if wait or self._last_process_data is None:
+            self._last_process_data = future.result()
+    
+    def store_process_data(self, future):
+        """Done callback: cache the process list built on the worker thread"""
+        self._last_process_data = future.result()
+    
+    def collect_snapshot(self, refresh_processes=True, wait_for_processes=True):
+        """Collect fresh GPU data (and optionally processes) and store it as the latest snapshot"""
+        if refresh_processes or self._last_process_data is None:
+            self.refresh_process_data(wait_for_processes)
+        
+        snapshot = {
+            'gpu_info': self.data_collector.get_gpu_data(),
+            'processes': self._last_process_data,
+            'timestamp': datetime.now().isoformat()
+        }
+        with self.snapshot_lock:
+            self.latest_snapshot = snapshot
+            self.latest_snapshot_time = time.monotonic()
+        return snapshot
+    
+    def diff_gpu_info(self, gpu_data):
+        """Return only the fields of each GPU that changed since the last broadcast"""
+        previous = {gpu['index']: gpu for gpu in self._last_gpu_info}
+        delta = []
+        for gpu in gpu_data:
+            old = previous.get(gpu['index'])
+            if old is None:
+                delta.append(gpu)
+                continue
+            changed = {key: value for key, value in gpu.items() if old.get(key) != value}
+            if changed:
+                changed['index'] = gpu['index']
+                delta.append(changed)
+        return delta
+    
     def update_data(self):
         """Background thread to collect and broadcast GPU data"""
+        tick = 0
         while self.running:
+            # Nobody is watching: skip collection, and pause the nvidia-smi stream once REST reads stop too
+            if self.connected_clients == 0:
+                if not self.running_idle:
+                    logger.info("No clients connected - pausing data collection")
+                    self.running_idle = True
+                self.data_collector.stop_idle_gpu_stream()
+                time.sleep(self.update_interval)
+                continue
+            
+            if self.running_idle:
+                logger.info("Client connected - resuming data collection")
+                self.running_idle = False
+            
             try:
-                gpu_data = self.data_collector.get_gpu_data()
-                process_data = self.data_collector.get_process_data()
+                snapshot = self.collect_snapshot(tick % self.process_update_ratio == 0, wait_for_processes=False)
+                tick += 1
+                gpu_data = snapshot['gpu_info']
+                process_data = snapshot['processes']
+                
+                # One timestamp per tick, shared by the snapshot, history and broadcast
+                timestamp = snapshot['timestamp']
+                payload = {
+                    'timestamp': timestamp,
+                    'client_count': self.connected_clients,
+                    'new_samples': []
+                }
                 
                 if gpu_data:
-                    # Store history for charts
-                    self.gpu_history.append({
-                        'timestamp': datetime.now().isoformat(),
-                        'temperature': float(gpu_data[0]['temperature']),
-                        'power': float(gpu_data[0]['power_draw'])
-                    })
+                    # Store history for charts; clients only get the newest entry
+                    sample = {
+                        'timestamp': timestamp,
+                        'label': timestamp[11:16],  # HH:MM chart label, formatted once here for every client
+                        'temperature': gpu_data[0]['temperature'],
+                        'power': gpu_data[0]['power_draw']
+                    }
+                    self.gpu_history.append(sample)
+                    payload['new_samples'].append(sample)
+                payload['seq'] = self.gpu_history.seq
+                
+                # Resend everything after a client joins so it can't miss fields
+                # that changed between its history_full and this tick
+                if self._send_full:
+                    self._send_full = False
+                    self._last_gpu_info = []
+                    self._last_processes = None
                 
-                # Broadcast to all connected clients
-                self.socketio.emit('gpu_update', {
-                    'gpu_info': gpu_data,
-                    'processes': process_data,
-                    'history': list(self.gpu_history),
-                    'timestamp': datetime.now().isoformat(),
-                    'client_count': self.connected_clients
-                })
+                gpu_delta = self.diff_gpu_info(gpu_data)
+                if gpu_delta:
+                    payload['gpu_delta'] = gpu_delta
+                if process_data != self._last_processes:
+                    payload['processes'] = process_data
+                
+                # Send to the monitoring room; python-socketio encodes the packet once for all members
+                self.socketio.emit('gpu_update_delta', payload, to=MONITOR_ROOM)
+                self._last_gpu_info = gpu_data
+                self._last_processes = process_data
                 
             except Exception as e:
                 logger.error(f"Error in update_data - {str(e)}")
             
             time.sleep(self.update_interval)
     
+    def test_gpu_collection(self):
+        """Log the GPUs found by a first data collection"""
+        logger.info("Testing GPU data collection...")
+        test_data = self.data_collector.get_gpu_data()
+        if test_data:
+            logger.info(f"GPU data test successful - found {len(test_data)} GPU(s)")
+            for i, gpu in enumerate(test_data):
+                logger.info(f"GPU {i}: {gpu.get('name', 'Unknown')} - {gpu.get('driver_version', 'Unknown driver')}")
+        else:
+            logger.warning("GPU data test failed - no GPU data available")
+    
     def start_server(self):
         logger.info("Starting NVIDIA GPU Monitor Web Server...")
         try:
-            # Check if port 9876 is available
+            # Check if port 9876 is available by binding it; this fails immediately
+            # instead of waiting on a connect timeout
             import socket
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex(('localhost', 9876))
-            sock.close()
-            
-            if result == 0:
-                logger.warning("Port 9876 is already in use!")
-                logger.warning("Another instance might be running or port is blocked")
-            else:
-                logger.info("Port 9876 is available")
+            # On Windows SO_REUSEADDR lets a second socket bind a port that is in
+            # use, which would defeat the check, so only set it elsewhere
+            if sys.platform != 'win32':
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(('0.0.0.0', 9876))
+            except OSError as e:
+                logger.error(f"Port 9876 is already in use - {str(e)}")
+                logger.error("Another instance might be running or port is blocked")
+                return
+            finally:
+                sock.close()
+            logger.info("Port 9876 is available")
             
             self.running = True
+            self.data_collector.start_keepalive()
             
             # Start data update thread
             logger.info("Starting data update thread...")
-            update_thread = threading.Thread(target=self.update_data, daemon=True)
-            update_thread.start()
+            self.socketio.start_background_task(self.update_data)
             logger.info("Data update thread started successfully")
             
-            # Test GPU data collection before starting server
-            logger.info("Testing GPU data collection...")
-            test_data = self.data_collector.get_gpu_data()
-            if test_data:
-                logger.info(f"GPU data test successful - found {len(test_data)} GPU(s)")
-                for i, gpu in enumerate(test_data):
-                    logger.info(f"GPU {i}: {gpu.get('name', 'Unknown')} - {gpu.get('driver_version', 'Unknown driver')}")
-            else:
-                logger.warning("GPU data test failed - no GPU data available")
+            # Test GPU data collection alongside the server so a slow first nvidia-smi call doesn't hold up startup
+            self.socketio.start_background_task(self.test_gpu_collection)
             
             logger.info("Starting Flask-SocketIO server on http://0.0.0.0:9876")
             logger.info("Web interface will be available at:")
@@ -386,6 +884,12 @@ class NvidiaWebServer:
     
     def stop_server(self):
         self.running = False
+        self.data_collector.stop_gpu_stream()
+        self.data_collector.stop_keepalive()
+
+# Per-user Run key used for the auto-start toggle
+AUTOSTART_KEY_PATH = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
+AUTOSTART_APP_NAME = "RTX System Stats"
 
 class SystemTrayApp:
     def __init__(self):
@@ -393,6 +897,10 @@ class SystemTrayApp:
         try:
             self.server = NvidiaWebServer()
             self.server_thread = None
+            
+            # Auto-start state is read once here; toggles flip it and write the registry in the background
+            self._autostart_lock = threading.Lock()
+            self._autostart_enabled = self.read_autostart()
             logger.info("SystemTrayApp initialization complete")
         except Exception as e:
             logger.error(f"Failed to initialize SystemTrayApp - {str(e)}")
@@ -453,27 +961,46 @@ class SystemTrayApp:
             if icon:
                 icon.notify(f"Failed to open browser - {str(e)}")
     
-    def toggle_autostart(self, icon, item):
+    def read_autostart(self):
+        """Return whether the auto-start Run entry exists, using a read-only key"""
         try:
-            key_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
-            app_name = "RTX System Stats"
-            exe_path = os.path.abspath(sys.executable if hasattr(sys, 'frozen') else "rtxss.exe")
-            
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_ALL_ACCESS) as key:
-                try:
-                    winreg.QueryValueEx(key, app_name)
-                    # Key exists, remove it
-                    winreg.DeleteValue(key, app_name)
-                    icon.notify("Auto-start disabled")
-                    logger.info("Auto-start disabled")
-                except FileNotFoundError:
-                    # Key doesn't exist, add it
-                    winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, exe_path)
-                    icon.notify("Auto-start enabled")
-                    logger.info("Auto-start enabled")
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY_PATH, 0, winreg.KEY_QUERY_VALUE) as key:
+                winreg.QueryValueEx(key, AUTOSTART_APP_NAME)
+                return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
-            icon.notify(f"Error toggling auto-start - {str(e)}")
-            logger.error(f"Error toggling auto-start - {str(e)}")
+            logger.error(f"Error reading auto-start state - {str(e)}")
+            return False
+    
+    def write_autostart(self, icon):
+        """Background thread: make the auto-start Run entry match the current toggle state"""
+        exe_path = os.path.abspath(sys.executable if hasattr(sys, 'frozen') else "rtxss.exe")
+        with self._autostart_lock:
+            # Read the state under the lock so whichever write runs last stores the latest toggle
+            enabled = self._autostart_enabled
+            try:
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY_PATH, 0, winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE) as key:
+                    if enabled:
+                        winreg.SetValueEx(key, AUTOSTART_APP_NAME, 0, winreg.REG_SZ, exe_path)
+                    else:
+                        try:
+                            winreg.DeleteValue(key, AUTOSTART_APP_NAME)
+                        except FileNotFoundError:
+                            pass
+                logger.info(f"Auto-start {'enabled' if enabled else 'disabled'}")
+            except Exception as e:
+                # Resync the cached state with whatever the registry actually holds
+                self._autostart_enabled = self.read_autostart()
+                icon.notify(f"Error toggling auto-start - {str(e)}")
+                logger.error(f"Error toggling auto-start - {str(e)}")
+    
+    def toggle_autostart(self, icon, item):
+        self._autostart_enabled = not self._autostart_enabled
+        enabled = self._autostart_enabled
+        icon.notify(f"Auto-start {'enabled' if enabled else 'disabled'}")
+        # Not a daemon thread, so quitting right after a toggle still finishes the write
+        threading.Thread(target=self.write_autostart, args=(icon,)).start()
     
     def quit_app(self, icon, item):
         self.server.stop_server()
@@ -506,648 +1033,109 @@ HTML_TEMPLATE = '''
     <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=yes">
     <title>NVIDIA GPU Monitor</title>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.1/socket.io.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.9.1/chart.min.js"></script>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
+    <link rel="stylesheet" href="/static/rtxss.css?v={{ asset_version }}">
+</head>
+<body>
+    <div class="app-container">
+        <header class="header">
+            <div class="header-content">
+                <h1 class="header-title">RTXSS - Nvidia Video Card Statistics Server</h1>
+                <div class="server-status">
+                    <span class="status-indicator" id="serverStatus"></span>
+                    <span class="status-text" id="serverStatusText">Connecting...</span>
+                </div>
+            </div>
+        </header>
         
-        :root {
-            --bg-primary: #1e1e1e;
-            --bg-secondary: #2b2b2b;
-            --bg-tertiary: #3b3b3b;
-            --accent-color: #4a9eff;
-            --accent-hover: #5ba7ff;
-            --accent-active: #3a8edf;
-            --border-color: #555;
-            --text-primary: white;
-            --text-secondary: #ccc;
-            --success-color: #2ecc71;
-            --error-color: #e74c3c;
-            
-            --spacing-xs: 0.25rem;
-            --spacing-sm: 0.5rem;
-            --spacing-md: 1rem;
-            --spacing-lg: 1.5rem;
-            --spacing-xl: 2rem;
+        <section class="gpu-section">
+            <div class="table-container gpu-table-container">
+                <table id="gpuTable">
+                    <thead>
+                        <tr>
+                            <th>Name</th>
+                            <th>Temp</th>
+                            <th>Fan</th>
+                            <th>Power</th>
+                            <th>GPU%</th>
+                            <th>Mem%</th>
+                            <th>Memory</th>
+                            <th>PCIe Gen</th>
+                            <th>Lanes</th>
+                            <th>GT/s</th>
+                            <th>Driver</th>
+                            <th>CUDA</th>
+                        </tr>
+                    </thead>
+                    <tbody></tbody>
+                </table>
+            </div>
+        </section>
+        
+        <main class="main-content">
+            <section class="panel">
+                <div class="panel-header">
+                    <h2 class="panel-title">Control</h2>
+                </div>
+                <div class="panel-content">
+                    <div class="power-control">
+                        <div class="power-status" id="currentPowerLimit">Max Wattage: Unknown</div>
+                        <div class="power-status" id="currentTemperature">Temperature: --°C</div>
+                        <div class="power-status" id="currentPower">Current: --W</div>
+                        
+                        <div class="power-section">
+                            <div class="power-section-title">Power Limits</div>
+                            <div class="power-buttons">
+                                <button class="btn" data-wattage="400">400W</button>
+                                <button class="btn" data-wattage="450">450W</button>
+                                <button class="btn" data-wattage="500">500W</button>
+                                <button class="btn" data-wattage="550">550W</button>
+                                <button class="btn" data-wattage="600">600W</button>
+                            </div>
+                        </div>
+                        
+                        <div class="power-section">
+                            <div class="power-section-title">Status Log</div>
+                            <div class="power-log" id="powerLog"></div>
+                        </div>
+                    </div>
+                </div>
+            </section>
             
-            --border-radius: 0.5rem;
-            --border-radius-sm: 0.25rem;
+            <section class="panel chart-panel">
+                <div class="panel-header">
+                    <h2 class="panel-title">GPU Metrics History</h2>
+                </div>
+                <div class="panel-content">
+                    <div class="chart-section">
+                        <div class="chart-container">
+                            <canvas id="temperatureChart"></canvas>
+                        </div>
+                        <div class="chart-container">
+                            <canvas id="powerChart"></canvas>
+                        </div>
+                    </div>
+                </div>
+            </section>
             
-            --font-size-base: 0.875rem;
-            --min-touch-target: 2.75rem;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background-color: var(--bg-primary);
-            color: var(--text-primary);
-            line-height: 1.5;
-            font-size: var(--font-size-base);
-            -webkit-text-size-adjust: 100%;
-            -webkit-tap-highlight-color: transparent;
-        }
-        
-        .app-container {
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-            max-width: 1920px;
-            margin: 0 auto;
-            padding: var(--spacing-sm);
-            gap: var(--spacing-sm);
-        }
-        
-        /* Header Component */
-        .header {
-            background-color: var(--bg-secondary);
-            padding: var(--spacing-md);
-            border-radius: var(--border-radius);
-            border: 1px solid var(--border-color);
-            flex-shrink: 0;
-        }
-        
-        .header-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: var(--spacing-md);
-        }
-        
-        .header-title {
-            font-size: 1.25rem;
-            font-weight: bold;
-            color: var(--accent-color);
-            margin: 0;
-            text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3);
-        }
-        
-        .server-status {
-            display: flex;
-            align-items: center;
-            gap: var(--spacing-sm);
-            padding: var(--spacing-xs) var(--spacing-sm);
-            background-color: var(--bg-primary);
-            border: 1px solid var(--border-color);
-            border-radius: var(--border-radius-sm);
-        }
-        
-        .status-indicator {
-            display: inline-block;
-            width: 0.75rem;
-            height: 0.75rem;
-            border-radius: 50%;
-            border: 2px solid transparent;
-            transition: all 0.3s ease;
-            box-shadow: 0 0 4px rgba(0, 0, 0, 0.3);
-        }
-        
-        .status-indicator.server-up {
-            background-color: var(--success-color);
-            border-color: #27ae60;
-            box-shadow: 0 0 8px rgba(46, 204, 113, 0.6);
-        }
-        
-        .status-indicator.server-down {
-            background-color: var(--error-color);
-            border-color: #c0392b;
-            box-shadow: 0 0 8px rgba(231, 76, 60, 0.6);
-        }
-        
-        .status-indicator.server-connecting {
-            background-color: #f39c12;
-            border-color: #e67e22;
-            box-shadow: 0 0 8px rgba(243, 156, 18, 0.6);
-            animation: pulse 1.5s infinite;
-        }
-        
-        .status-text {
-            font-size: var(--font-size-base);
-            font-weight: 500;
-            color: var(--text-secondary);
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.6; }
-        }
-        
-        /* GPU Info Component */
-        .gpu-section {
-            background-color: var(--bg-secondary);
-            border-radius: var(--border-radius);
-            border: 1px solid var(--border-color);
-            overflow: hidden;
-            flex-shrink: 0;
-        }
-        
-        /* Main Content Grid */
-        .main-content {
-            display: grid;
-            gap: var(--spacing-sm);
-            flex: 1;
-            min-height: 0;
-        }
-        
-        /* Panel Component */
-        .panel {
-            background-color: var(--bg-secondary);
-            border-radius: var(--border-radius);
-            border: 1px solid var(--border-color);
-            display: flex;
-            flex-direction: column;
-            min-height: 0;
-            overflow: hidden;
-        }
-        
-        .panel-header {
-            padding: var(--spacing-md) var(--spacing-md) var(--spacing-sm);
-            border-bottom: 1px solid var(--border-color);
-            flex-shrink: 0;
-        }
-        
-        .panel-title {
-            color: var(--accent-color);
-            font-size: var(--font-size-base);
-            font-weight: bold;
-            margin: 0;
-        }
-        
-        .panel-content {
-            padding: var(--spacing-md);
-            flex: 1;
-            overflow: auto;
-            min-height: 0;
-        }
-        
-        /* Table Component */
-        .table-container {
-            overflow: auto;
-            -webkit-overflow-scrolling: touch;
-            border-radius: var(--border-radius-sm);
-            border: 1px solid var(--border-color);
-        }
-        
-        /* Specific height constraints for different tables */
-        .gpu-table-container {
-            max-height: 60vh;
-        }
-        
-        .process-table-container {
-            max-height: 400px; /* Match approximate height of power control panel */
-            overflow-y: auto;
-            overflow-x: hidden;
-        }
-        
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            font-size: var(--font-size-base);
-        }
-        
-        th, td {
-            padding: var(--spacing-sm);
-            text-align: left;
-            border-bottom: 1px solid var(--border-color);
-            font-size: var(--font-size-base);
-        }
-        
-        th {
-            background-color: var(--bg-tertiary);
-            color: var(--accent-color);
-            cursor: pointer;
-            user-select: none;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-            font-weight: bold;
-            transition: background-color 0.2s;
-        }
-        
-        th:hover {
-            background-color: var(--border-color);
-        }
-        
-        tr:hover {
-            background-color: rgba(255, 255, 255, 0.05);
-        }
-        
-        /* Chart Component */
-        .chart-section {
-            display: flex;
-            flex-direction: column;
-            gap: var(--spacing-md);
-            flex: 1;
-            min-height: 0;
-        }
-        
-        .chart-container {
-            position: relative;
-            flex: 1;
-            min-height: 150px;
-            height: 0;
-        }
-        
-        /* Power Control Component */
-        .power-control {
-            display: flex;
-            flex-direction: column;
-            gap: var(--spacing-md);
-            min-width: 250px;
-        }
-        
-        .power-status {
-            padding: var(--spacing-sm);
-            background-color: var(--bg-primary);
-            border: 1px solid var(--border-color);
-            border-radius: var(--border-radius-sm);
-            font-weight: bold;
-            color: var(--success-color);
-            font-size: var(--font-size-base);
-        }
-        
-        .power-section {
-            display: flex;
-            flex-direction: column;
-            gap: var(--spacing-sm);
-        }
-        
-        .power-section-title {
-            font-size: var(--font-size-base);
-            font-weight: bold;
-            color: var(--text-secondary);
-            margin-bottom: var(--spacing-xs);
-        }
-        
-        .power-buttons {
-            display: grid;
-            gap: var(--spacing-sm);
-            grid-template-columns: repeat(auto-fit, minmax(3rem, 1fr));
-        }
-        
-        .power-log {
-            background-color: var(--bg-primary);
-            border: 1px solid var(--border-color);
-            border-radius: var(--border-radius-sm);
-            padding: var(--spacing-sm);
-            font-family: 'Courier New', monospace;
-            font-size: var(--font-size-base);
-            overflow-y: auto;
-            flex: 1;
-            min-height: 100px;
-            max-height: 200px;
-            -webkit-overflow-scrolling: touch;
-        }
-        
-        /* Button Component */
-        .btn {
-            background-color: var(--accent-color);
-            color: var(--text-primary);
-            border: none;
-            padding: var(--spacing-sm) var(--spacing-md);
-            border-radius: var(--border-radius-sm);
-            cursor: pointer;
-            font-weight: normal;
-            font-size: var(--font-size-base);
-            min-height: var(--min-touch-target);
-            transition: all 0.2s;
-            touch-action: manipulation;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }
-        
-        .btn:hover {
-            background-color: var(--accent-hover);
-        }
-        
-        .btn:active {
-            background-color: var(--accent-active);
-            transform: scale(0.98);
-        }
-        
-        /* Footer Component */
-        .footer {
-            background-color: var(--bg-secondary);
-            padding: var(--spacing-sm) var(--spacing-md);
-            border-radius: var(--border-radius);
-            border: 1px solid var(--border-color);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: var(--spacing-sm);
-            font-size: var(--font-size-base);
-            color: var(--text-secondary);
-            flex-shrink: 0;
-        }
-        
-        .footer-info {
-            display: flex;
-            align-items: center;
-            gap: var(--spacing-md);
-            flex-wrap: wrap;
-        }
-        
-        .interval-control {
-            display: flex;
-            align-items: center;
-            gap: var(--spacing-xs);
-        }
-        
-        .interval-input {
-            background-color: var(--bg-primary);
-            border: 1px solid var(--border-color);
-            border-radius: var(--border-radius-sm);
-            color: var(--text-primary);
-            padding: var(--spacing-xs) var(--spacing-sm);
-            width: 4rem;
-            font-size: var(--font-size-base);
-        }
-        
-        .interval-btn {
-            background-color: var(--accent-color);
-            color: var(--text-primary);
-            border: none;
-            padding: var(--spacing-xs) var(--spacing-sm);
-            border-radius: var(--border-radius-sm);
-            cursor: pointer;
-            font-size: var(--font-size-base);
-            min-height: auto;
-            transition: all 0.2s;
-        }
-        
-        .interval-btn:hover {
-            background-color: var(--accent-hover);
-        }
-        
-        /* Responsive Grid Layouts */
-        @media (min-width: 1400px) {
-            .main-content {
-                grid-template-columns: minmax(280px, 1fr) minmax(500px, 2fr) minmax(280px, 1fr);
-            }
-        }
-        
-        @media (min-width: 1200px) and (max-width: 1399px) {
-            .main-content {
-                grid-template-columns: minmax(250px, 1fr) minmax(400px, 1.8fr) minmax(250px, 1fr);
-            }
-        }
-        
-        @media (min-width: 1000px) and (max-width: 1199px) {
-            .main-content {
-                grid-template-columns: minmax(220px, 1fr) minmax(300px, 1.5fr) minmax(220px, 1fr);
-            }
-        }
-        
-        @media (min-width: 800px) and (max-width: 999px) {
-            .main-content {
-                grid-template-columns: 1fr 1.5fr 1fr;
-            }
-        }
-        
-        @media (min-width: 768px) and (max-width: 799px) {
-            .main-content {
-                grid-template-columns: 1fr 1fr;
-                grid-template-rows: auto auto;
-            }
-            
-            .chart-panel {
-                grid-column: 1 / -1;
-            }
-        }
-        
-        @media (max-width: 767px) {
-            .app-container {
-                padding: var(--spacing-xs);
-                gap: var(--spacing-xs);
-            }
-            
-            .main-content {
-                grid-template-columns: 1fr;
-            }
-            
-            .power-buttons {
-                grid-template-columns: 1fr 1fr;
-            }
-            
-            .chart-container {
-                min-height: 120px;
-            }
-            
-            .process-table-container {
-                max-height: 300px; /* Smaller on mobile */
-            }
-            
-            .footer {
-                flex-direction: column;
-                text-align: center;
-            }
-            
-            .footer-info {
-                justify-content: center;
-            }
-            
-            .header-content {
-                flex-direction: column;
-                align-items: center;
-                text-align: center;
-                gap: var(--spacing-sm);
-            }
-            
-            .header-title {
-                font-size: 1rem;
-            }
-        }
-        
-        @media (max-width: 480px) {
-            .power-buttons {
-                grid-template-columns: 1fr;
-            }
-            
-            .process-table-container {
-                max-height: 250px; /* Even smaller on very small screens */
-            }
-        }
-        
-        /* High zoom / small viewport adjustments */
-        @media (max-height: 600px) {
-            .chart-container {
-                min-height: 100px;
-            }
-            
-            .power-log {
-                min-height: 60px;
-                max-height: 100px;
-            }
-            
-            .process-table-container {
-                max-height: 200px; /* Reduce when viewport height is limited */
-            }
-        }
-        
-        /* Zoom-specific adjustments for fluid panels */
-        .power-control {
-            display: flex;
-            flex-direction: column;
-            gap: var(--spacing-md);
-            min-width: 200px;
-            max-width: 100%;
-        }
-        
-        /* Make panels more flexible */
-        .panel {
-            background-color: var(--bg-secondary);
-            border-radius: var(--border-radius);
-            border: 1px solid var(--border-color);
-            display: flex;
-            flex-direction: column;
-            min-height: 0;
-            overflow: hidden;
-            min-width: 0; /* Allow panels to shrink below content width */
-        }
-        
-        /* Scrollbar styling */
-        ::-webkit-scrollbar {
-            width: 6px;
-            height: 6px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: var(--bg-secondary);
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: var(--border-color);
-            border-radius: 3px;
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--text-secondary);
-        }
-        
-        /* Print styles */
-        @media print {
-            body {
-                background: white;
-                color: black;
-            }
-        }
-        
-        /* Reduced motion preference */
-        @media (prefers-reduced-motion: reduce) {
-            * {
-                animation-duration: 0.01ms !important;
-                animation-iteration-count: 1 !important;
-                transition-duration: 0.01ms !important;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="app-container">
-        <header class="header">
-            <div class="header-content">
-                <h1 class="header-title">RTXSS - Nvidia Video Card Statistics Server</h1>
-                <div class="server-status">
-                    <span class="status-indicator" id="serverStatus"></span>
-                    <span class="status-text" id="serverStatusText">Connecting...</span>
-                </div>
-            </div>
-        </header>
-        
-        <section class="gpu-section">
-            <div class="table-container gpu-table-container">
-                <table id="gpuTable">
-                    <thead>
-                        <tr>
-                            <th>Name</th>
-                            <th>Temp</th>
-                            <th>Fan</th>
-                            <th>Power</th>
-                            <th>GPU%</th>
-                            <th>Mem%</th>
-                            <th>Memory</th>
-                            <th>PCIe Gen</th>
-                            <th>Lanes</th>
-                            <th>GT/s</th>
-                            <th>Driver</th>
-                            <th>CUDA</th>
-                        </tr>
-                    </thead>
-                    <tbody></tbody>
-                </table>
-            </div>
-        </section>
-        
-        <main class="main-content">
-            <section class="panel">
-                <div class="panel-header">
-                    <h2 class="panel-title">Control</h2>
-                </div>
-                <div class="panel-content">
-                    <div class="power-control">
-                        <div class="power-status" id="currentPowerLimit">Max Wattage: Unknown</div>
-                        <div class="power-status" id="currentTemperature">Temperature: --°C</div>
-                        <div class="power-status" id="currentPower">Current: --W</div>
-                        
-                        <div class="power-section">
-                            <div class="power-section-title">Power Limits</div>
-                            <div class="power-buttons">
-                                <button class="btn" onclick="setPowerLimit(400)" ontouchstart="">400W</button>
-                                <button class="btn" onclick="setPowerLimit(450)" ontouchstart="">450W</button>
-                                <button class="btn" onclick="setPowerLimit(500)" ontouchstart="">500W</button>
-                                <button class="btn" onclick="setPowerLimit(550)" ontouchstart="">550W</button>
-                                <button class="btn" onclick="setPowerLimit(600)" ontouchstart="">600W</button>
-                            </div>
-                        </div>
-                        
-                        <div class="power-section">
-                            <div class="power-section-title">Status Log</div>
-                            <div class="power-log" id="powerLog"></div>
-                        </div>
-                    </div>
-                </div>
-            </section>
-            
-            <section class="panel chart-panel">
-                <div class="panel-header">
-                    <h2 class="panel-title">GPU Metrics History</h2>
-                </div>
-                <div class="panel-content">
-                    <div class="chart-section">
-                        <div class="chart-container">
-                            <canvas id="temperatureChart"></canvas>
-                        </div>
-                        <div class="chart-container">
-                            <canvas id="powerChart"></canvas>
-                        </div>
-                    </div>
-                </div>
-            </section>
-            
-            <section class="panel">
-                <div class="panel-header">
-                    <h2 class="panel-title">GPU Processes</h2>
-                </div>
-                <div class="panel-content">
-                    <div class="table-container process-table-container">
-                        <table id="processTable">
-                            <thead>
-                                <tr>
-                                    <th onclick="sortTable(0)" ontouchstart="">Process</th>
-                                    <th onclick="sortTable(1)" ontouchstart="">RAM%</th>
-                                </tr>
-                            </thead>
-                            <tbody></tbody>
-                        </table>
-                    </div>
-                </div>
-            </section>
-        </main>
+            <section class="panel">
+                <div class="panel-header">
+                    <h2 class="panel-title">GPU Processes</h2>
+                </div>
+                <div class="panel-content">
+                    <div class="table-container process-table-container">
+                        <table id="processTable">
+                            <thead>
+                                <tr>
+                                    <th data-col="0">Process</th>
+                                    <th data-col="1">RAM%</th>
+                                </tr>
+                            </thead>
+                            <tbody></tbody>
+                        </table>
+                    </div>
+                </div>
+            </section>
+        </main>
         
         <footer class="footer">
             <div class="footer-info">
@@ -1157,314 +1145,1075 @@ HTML_TEMPLATE = '''
             <div class="interval-control">
                 <span>Update (ms):</span>
                 <input type="number" id="intervalInput" class="interval-input" value="1000" min="100" max="10000" step="100">
-                <button class="interval-btn" onclick="setUpdateInterval()">Set</button>
+                <button class="interval-btn" id="intervalButton">Set</button>
             </div>
         </footer>
     </div>
 
-    <script>
-        const socket = io();
-        let temperatureChart, powerChart;
-        let sortDirection = {};
-        
-        // Prevent double-tap zoom on mobile
-        let lastTouchEnd = 0;
-        document.addEventListener('touchend', function (event) {
-            const now = Date.now();
-            if (now - lastTouchEnd <= 300) {
-                event.preventDefault();
+    <script src="/static/rtxss.js?v={{ asset_version }}"></script>
+</body>
+</html>
+'''
+
+# Dashboard stylesheet and script, served as separate cacheable files
+DASHBOARD_CSS = '''
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+:root {
+    --bg-primary: #1e1e1e;
+    --bg-secondary: #2b2b2b;
+    --bg-tertiary: #3b3b3b;
+    --accent-color: #4a9eff;
+    --accent-hover: #5ba7ff;
+    --accent-active: #3a8edf;
+    --border-color: #555;
+    --text-primary: white;
+    --text-secondary: #ccc;
+    --success-color: #2ecc71;
+    --error-color: #e74c3c;
+    
+    --spacing-xs: 0.25rem;
+    --spacing-sm: 0.5rem;
+    --spacing-md: 1rem;
+    --spacing-lg: 1.5rem;
+    --spacing-xl: 2rem;
+    
+    --border-radius: 0.5rem;
+    --border-radius-sm: 0.25rem;
+    
+    --font-size-base: 0.875rem;
+    --min-touch-target: 2.75rem;
+    
+    /* Narrowest the control and process panels get; the chart column's minimum scales from it */
+    --panel-min: clamp(160px, 20vw, 280px);
+}
+
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background-color: var(--bg-primary);
+    color: var(--text-primary);
+    line-height: 1.5;
+    font-size: var(--font-size-base);
+    -webkit-text-size-adjust: 100%;
+    -webkit-tap-highlight-color: transparent;
+}
+
+.app-container {
+    min-height: 100vh;
+    display: flex;
+    flex-direction: column;
+    max-width: 1920px;
+    margin: 0 auto;
+    padding: var(--spacing-sm);
+    gap: var(--spacing-sm);
+}
+
+/* Header Component */
+.header {
+    background-color: var(--bg-secondary);
+    padding: var(--spacing-md);
+    border-radius: var(--border-radius);
+    border: 1px solid var(--border-color);
+    flex-shrink: 0;
+}
+
+.header-content {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    flex-wrap: wrap;
+    gap: var(--spacing-md);
+}
+
+.header-title {
+    font-size: 1.25rem;
+    font-weight: bold;
+    color: var(--accent-color);
+    margin: 0;
+    text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3);
+}
+
+.server-status {
+    display: flex;
+    align-items: center;
+    gap: var(--spacing-sm);
+    padding: var(--spacing-xs) var(--spacing-sm);
+    background-color: var(--bg-primary);
+    border: 1px solid var(--border-color);
+    border-radius: var(--border-radius-sm);
+}
+
+.status-indicator {
+    display: inline-block;
+    width: 0.75rem;
+    height: 0.75rem;
+    border-radius: 50%;
+    border: 2px solid transparent;
+    transition: background-color 0.3s ease, border-color 0.3s ease, box-shadow 0.3s ease;
+    box-shadow: 0 0 4px rgba(0, 0, 0, 0.3);
+}
+
+.status-indicator.server-up {
+    background-color: var(--success-color);
+    border-color: #27ae60;
+    box-shadow: 0 0 8px rgba(46, 204, 113, 0.6);
+}
+
+.status-indicator.server-down {
+    background-color: var(--error-color);
+    border-color: #c0392b;
+    box-shadow: 0 0 8px rgba(231, 76, 60, 0.6);
+}
+
+.status-indicator.server-connecting {
+    background-color: #f39c12;
+    border-color: #e67e22;
+    box-shadow: 0 0 8px rgba(243, 156, 18, 0.6);
+    animation: pulse 1.5s infinite;
+}
+
+.status-text {
+    font-size: var(--font-size-base);
+    font-weight: 500;
+    color: var(--text-secondary);
+}
+
+@keyframes pulse {
+    0%, 100% { opacity: 1; }
+    50% { opacity: 0.6; }
+}
+
+/* GPU Info Component */
+.gpu-section {
+    background-color: var(--bg-secondary);
+    border-radius: var(--border-radius);
+    border: 1px solid var(--border-color);
+    overflow: hidden;
+    flex-shrink: 0;
+}
+
+/* Main Content Grid - the chart column gets twice the share of the panels either side */
+.main-content {
+    display: grid;
+    grid-template-columns: minmax(var(--panel-min), 1fr) minmax(calc(var(--panel-min) * 1.5), 2fr) minmax(var(--panel-min), 1fr);
+    gap: var(--spacing-sm);
+    flex: 1;
+    min-height: 0;
+}
+
+/* Panel Component */
+.panel {
+    background-color: var(--bg-secondary);
+    border-radius: var(--border-radius);
+    border: 1px solid var(--border-color);
+    display: flex;
+    flex-direction: column;
+    min-height: 0;
+    overflow: hidden;
+    min-width: 0; /* Allow panels to shrink below content width */
+    contain: layout paint style; /* Updates inside one panel never re-lay out the others */
+}
+
+.panel-header {
+    padding: var(--spacing-md) var(--spacing-md) var(--spacing-sm);
+    border-bottom: 1px solid var(--border-color);
+    flex-shrink: 0;
+}
+
+.panel-title {
+    color: var(--accent-color);
+    font-size: var(--font-size-base);
+    font-weight: bold;
+    margin: 0;
+}
+
+.panel-content {
+    padding: var(--spacing-md);
+    flex: 1;
+    overflow: auto;
+    min-height: 0;
+}
+
+/* Table Component */
+.table-container {
+    overflow: auto;
+    -webkit-overflow-scrolling: touch;
+    border-radius: var(--border-radius-sm);
+    border: 1px solid var(--border-color);
+}
+
+/* Specific height constraints for different tables */
+.gpu-table-container {
+    max-height: 60vh;
+}
+
+.process-table-container {
+    max-height: clamp(200px, 45vh, 400px); /* Match approximate height of power control panel */
+    overflow-y: auto;
+    overflow-x: hidden;
+    content-visibility: auto;
+    contain-intrinsic-size: auto 300px;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: var(--font-size-base);
+}
+
+th, td {
+    padding: var(--spacing-sm);
+    text-align: left;
+    border-bottom: 1px solid var(--border-color);
+    font-size: var(--font-size-base);
+}
+
+th {
+    background-color: var(--bg-tertiary);
+    color: var(--accent-color);
+    cursor: pointer;
+    user-select: none;
+    position: sticky;
+    top: 0;
+    z-index: 10;
+    font-weight: bold;
+    transition: background-color 0.2s;
+}
+
+th:hover {
+    background-color: var(--border-color);
+}
+
+tr:hover {
+    background-color: rgba(255, 255, 255, 0.05);
+}
+
+/* Chart Component */
+.chart-section {
+    display: flex;
+    flex-direction: column;
+    gap: var(--spacing-md);
+    flex: 1;
+    min-height: 0;
+}
+
+.chart-container {
+    position: relative;
+    flex: 1;
+    min-height: clamp(100px, 18vh, 150px);
+    height: 0;
+    content-visibility: auto; /* Skip rendering charts scrolled out of view */
+    contain-intrinsic-size: auto 300px;
+}
+
+.chart-container canvas {
+    position: absolute;
+    inset: 0;
+    width: 100%;
+    height: 100%;
+}
+
+/* Power Control Component */
+.power-control {
+    display: flex;
+    flex-direction: column;
+    gap: var(--spacing-md);
+    min-width: 200px;
+    max-width: 100%;
+}
+
+.power-status {
+    padding: var(--spacing-sm);
+    background-color: var(--bg-primary);
+    border: 1px solid var(--border-color);
+    border-radius: var(--border-radius-sm);
+    font-weight: bold;
+    color: var(--success-color);
+    font-size: var(--font-size-base);
+}
+
+.power-section {
+    display: flex;
+    flex-direction: column;
+    gap: var(--spacing-sm);
+}
+
+.power-section-title {
+    font-size: var(--font-size-base);
+    font-weight: bold;
+    color: var(--text-secondary);
+    margin-bottom: var(--spacing-xs);
+}
+
+.power-buttons {
+    display: grid;
+    gap: var(--spacing-sm);
+    grid-template-columns: repeat(auto-fit, minmax(3rem, 1fr));
+}
+
+.power-log {
+    background-color: var(--bg-primary);
+    border: 1px solid var(--border-color);
+    border-radius: var(--border-radius-sm);
+    padding: var(--spacing-sm);
+    font-family: 'Courier New', monospace;
+    font-size: var(--font-size-base);
+    overflow-y: auto;
+    flex: 1;
+    min-height: clamp(60px, 12vh, 100px);
+    max-height: clamp(100px, 25vh, 200px);
+    -webkit-overflow-scrolling: touch;
+}
+
+/* Button Component */
+.btn {
+    background-color: var(--accent-color);
+    color: var(--text-primary);
+    border: none;
+    padding: var(--spacing-sm) var(--spacing-md);
+    border-radius: var(--border-radius-sm);
+    cursor: pointer;
+    font-weight: normal;
+    font-size: var(--font-size-base);
+    min-height: var(--min-touch-target);
+    transition: background-color 0.2s, transform 0.2s;
+    will-change: transform; /* Keep the press scale on the compositor */
+    touch-action: manipulation;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+
+.btn:hover {
+    background-color: var(--accent-hover);
+}
+
+.btn:active {
+    background-color: var(--accent-active);
+    transform: scale(0.98);
+}
+
+/* Footer Component */
+.footer {
+    background-color: var(--bg-secondary);
+    padding: var(--spacing-sm) var(--spacing-md);
+    border-radius: var(--border-radius);
+    border: 1px solid var(--border-color);
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    flex-wrap: wrap;
+    gap: var(--spacing-sm);
+    font-size: var(--font-size-base);
+    color: var(--text-secondary);
+    flex-shrink: 0;
+}
+
+.footer-info {
+    display: flex;
+    align-items: center;
+    gap: var(--spacing-md);
+    flex-wrap: wrap;
+}
+
+.interval-control {
+    display: flex;
+    align-items: center;
+    gap: var(--spacing-xs);
+}
+
+.interval-input {
+    background-color: var(--bg-primary);
+    border: 1px solid var(--border-color);
+    border-radius: var(--border-radius-sm);
+    color: var(--text-primary);
+    padding: var(--spacing-xs) var(--spacing-sm);
+    width: 4rem;
+    font-size: var(--font-size-base);
+}
+
+.interval-btn {
+    background-color: var(--accent-color);
+    color: var(--text-primary);
+    border: none;
+    padding: var(--spacing-xs) var(--spacing-sm);
+    border-radius: var(--border-radius-sm);
+    cursor: pointer;
+    font-size: var(--font-size-base);
+    min-height: auto;
+    transition: background-color 0.2s;
+}
+
+.interval-btn:hover {
+    background-color: var(--accent-hover);
+}
+
+/* Too narrow for three columns: control and processes share a row, the chart takes a full one */
+@media (max-width: 799px) {
+    .main-content {
+        grid-template-columns: 1fr 1fr;
+        grid-auto-flow: row dense;
+    }
+    
+    .chart-panel {
+        grid-column: 1 / -1;
+    }
+}
+
+/* Small screens: one panel per row */
+@media (max-width: 767px) {
+    .main-content {
+        grid-template-columns: 1fr;
+    }
+    
+    .app-container {
+        padding: var(--spacing-xs);
+        gap: var(--spacing-xs);
+    }
+    
+    .power-buttons {
+        grid-template-columns: 1fr 1fr;
+    }
+    
+    .footer {
+        flex-direction: column;
+        text-align: center;
+    }
+    
+    .footer-info {
+        justify-content: center;
+    }
+    
+    .header-content {
+        flex-direction: column;
+        align-items: center;
+        text-align: center;
+        gap: var(--spacing-sm);
+    }
+    
+    .header-title {
+        font-size: 1rem;
+    }
+}
+
+@media (max-width: 480px) {
+    .power-buttons {
+        grid-template-columns: 1fr;
+    }
+}
+
+/* Scrollbar styling */
+::-webkit-scrollbar {
+    width: 6px;
+    height: 6px;
+}
+
+::-webkit-scrollbar-track {
+    background: var(--bg-secondary);
+}
+
+::-webkit-scrollbar-thumb {
+    background: var(--border-color);
+    border-radius: 3px;
+}
+
+::-webkit-scrollbar-thumb:hover {
+    background: var(--text-secondary);
+}
+
+/* Print styles */
+@media print {
+    body {
+        background: white;
+        color: black;
+    }
+}
+
+/* Reduced motion preference */
+@media (prefers-reduced-motion: reduce) {
+    * {
+        animation-duration: 0.01ms !important;
+        animation-iteration-count: 1 !important;
+        transition-duration: 0.01ms !important;
+    }
+}
+'''
+
+DASHBOARD_JS = '''
+// On every (re)connect, tell the server the last sample we have so it can backfill the gap
+const socket = io({
+    transports: ['websocket', 'polling'],
+    auth: cb => cb({ last_seq: lastSeq })
+});
+let temperatureChart, powerChart;
+let sortDirection = {};
+
+// Hot DOM nodes, looked up once when the page loads
+let el = null;
+
+// Local copy of the server state that gpu_update_delta events are merged into
+const MAX_HISTORY = 60;  // matches the server's gpu_history length
+let gpuState = [];
+let processState = [];
+let historyState = [];
+let lastSeq = 0;
+
+const MAX_LOG_LINES = 100;
+
+// Prevent double-tap zoom on mobile
+let lastTouchEnd = 0;
+document.addEventListener('touchend', function (event) {
+    const now = Date.now();
+    if (now - lastTouchEnd <= 300) {
+        event.preventDefault();
+    }
+    lastTouchEnd = now;
+}, false);
+
+// Charts are plain canvas sparklines: each series lives in a fixed ring buffer and is
+// stroked as a single Path2D, so no charting library has to be downloaded or run
+function createSparkline(id, name, unit, color) {
+    const canvas = document.getElementById(id);
+    return {
+        canvas: canvas,
+        ctx: canvas.getContext('2d'),
+        name: name,
+        unit: unit,
+        color: color,
+        values: new Float64Array(MAX_HISTORY),
+        labels: new Array(MAX_HISTORY).fill(''),
+        start: 0,
+        count: 0,
+        width: 0,
+        height: 0,
+        pendingSize: null
+    };
+}
+
+function initCharts() {
+    temperatureChart = createSparkline('temperatureChart', 'Temp', '°C', '#ff6b6b');
+    powerChart = createSparkline('powerChart', 'Power', 'W', '#4ecdc4');
+    
+    // Read both container sizes before either canvas is resized
+    const charts = [temperatureChart, powerChart];
+    const rects = charts.map(chart => chart.canvas.parentElement.getBoundingClientRect());
+    charts.forEach((chart, i) => resizeSparkline(chart, rects[i].width, rects[i].height));
+}
+
+function pushSparkline(chart, label, value) {
+    const slot = (chart.start + chart.count) % MAX_HISTORY;
+    chart.values[slot] = value;  // non-numeric readings become NaN and leave a gap
+    chart.labels[slot] = label;
+    if (chart.count < MAX_HISTORY) {
+        chart.count++;
+    } else {
+        chart.start = (chart.start + 1) % MAX_HISTORY;
+    }
+}
+
+// Match the backing store to the container size and device pixel ratio, then redraw
+// Only writes: callers measure the container first, so no layout read follows a canvas resize
+function resizeSparkline(chart, width, height) {
+    const ratio = window.devicePixelRatio || 1;
+    chart.width = width;
+    chart.height = height;
+    chart.canvas.width = Math.max(1, Math.round(width * ratio));
+    chart.canvas.height = Math.max(1, Math.round(height * ratio));
+    chart.ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    drawSparkline(chart);
+}
+
+function drawSparkline(chart) {
+    const ctx = chart.ctx;
+    const W = chart.width, H = chart.height;
+    ctx.clearRect(0, 0, W, H);
+    
+    let mn = Infinity, mx = -Infinity, latest = NaN;
+    for (let i = 0; i < chart.count; i++) {
+        const v = chart.values[(chart.start + i) % MAX_HISTORY];
+        if (Number.isNaN(v)) continue;
+        if (v < mn) mn = v;
+        if (v > mx) mx = v;
+        latest = v;
+    }
+    
+    // Plot area leaves room for the title above and the axis labels to the left and below
+    const left = 44, right = W - 8, top = 26, bottom = H - 20;
+    ctx.font = '14px "Segoe UI", sans-serif';
+    ctx.fillStyle = 'white';
+    ctx.textBaseline = 'top';
+    ctx.textAlign = 'left';
+    ctx.fillText(Number.isNaN(latest) ? chart.name : `${chart.name} ${latest}${chart.unit}`, left, 4);
+    ctx.strokeStyle = '#555';
+    ctx.lineWidth = 1;
+    ctx.strokeRect(left, top, Math.max(0, right - left), Math.max(0, bottom - top));
+    if (Number.isNaN(latest) || right <= left || bottom <= top) return;
+    
+    if (mx === mn) {
+        mn -= 1;
+        mx += 1;
+    }
+    const s = (bottom - top) / (mx - mn);
+    const step = chart.count > 1 ? (right - left) / (chart.count - 1) : 0;
+    const path = new Path2D();
+    let penDown = false;
+    for (let i = 0; i < chart.count; i++) {
+        const v = chart.values[(chart.start + i) % MAX_HISTORY];
+        if (Number.isNaN(v)) {
+            penDown = false;  // lift the pen so the line breaks across missing readings
+            continue;
+        }
+        const x = left + i * step, y = bottom - (v - mn) * s;
+        if (penDown) {
+            path.lineTo(x, y);
+        } else {
+            path.moveTo(x, y);
+            penDown = true;
+        }
+    }
+    ctx.strokeStyle = chart.color;
+    ctx.lineWidth = 2;
+    ctx.stroke(path);
+    
+    ctx.textAlign = 'right';
+    ctx.textBaseline = 'middle';
+    ctx.fillText(String(Math.round(mx)), left - 6, top);
+    ctx.fillText(String(Math.round(mn)), left - 6, bottom);
+    ctx.textBaseline = 'top';
+    ctx.fillText(chart.labels[(chart.start + chart.count - 1) % MAX_HISTORY], right, bottom + 4);
+    ctx.textAlign = 'left';
+    ctx.fillText(chart.labels[chart.start], left, bottom + 4);
+}
+
+// Socket event handlers
+socket.on('connect', function() {
+    updateServerStatus('up', 'Server Online');
+    addToLog('Connected to server');
+});
+
+socket.on('disconnect', function() {
+    updateServerStatus('down', 'Server Offline');
+    addToLog('Disconnected from server');
+});
+
+socket.on('connect_error', function() {
+    updateServerStatus('down', 'Connection Error');
+    addToLog('Connection error');
+});
+
+socket.on('reconnect_attempt', function() {
+    updateServerStatus('connecting', 'Reconnecting...');
+});
+
+// Full state arrives once on connect, then the server only sends what changed
+socket.on('history_full', function(data) {
+    gpuState = data.gpu_info || [];
+    processState = data.processes || [];
+    updateGPUInfo(gpuState);
+    updateProcessTable(processState);
+    
+    if (data.backfill) {
+        appendSamples(data.history || []);
+    } else {
+        historyState = data.history || [];
+        lastSeq = historyState.length > 0 ? historyState[historyState.length - 1].seq : 0;
+        resetCharts();
+    }
+    updateCharts(historyState);
+});
+
+// Add samples the local history hasn't seen yet, keeping at most MAX_HISTORY
+function appendSamples(samples) {
+    samples.forEach(sample => {
+        if (sample.seq <= lastSeq) return;
+        historyState.push(sample);
+        lastSeq = sample.seq;
+    });
+    if (historyState.length > MAX_HISTORY) {
+        historyState.splice(0, historyState.length - MAX_HISTORY);
+    }
+}
+
+// State is merged as soon as an update arrives; the DOM writes it causes wait for the next frame
+socket.on('gpu_update_delta', function(data) {
+    if (data.gpu_delta) {
+        data.gpu_delta.forEach(function(change) {
+            const gpu = gpuState.find(g => g.index === change.index);
+            if (gpu) {
+                Object.assign(gpu, change);
+            } else {
+                gpuState.push(change);
             }
-            lastTouchEnd = now;
-        }, false);
-        
-        // Initialize charts with responsive options
-        function initCharts() {
-            const tempCtx = document.getElementById('temperatureChart').getContext('2d');
-            const powerCtx = document.getElementById('powerChart').getContext('2d');
-            
-            const chartOptions = {
-                responsive: true,
-                maintainAspectRatio: false,
-                interaction: {
-                    intersect: false,
-                    mode: 'index'
-                },
-                plugins: {
-                    legend: { 
-                        labels: { 
-                            color: 'white',
-                            font: { size: 14 }
-                        }
-                    }
-                },
-                scales: {
-                    x: { 
-                        ticks: { 
-                            color: 'white',
-                            font: { size: 14 },
-                            maxTicksLimit: 8
-                        }, 
-                        grid: { color: '#555' }
-                    },
-                    y: { 
-                        ticks: { 
-                            color: 'white',
-                            font: { size: 14 }
-                        }, 
-                        grid: { color: '#555' }
-                    }
-                },
-                elements: {
-                    point: {
-                        radius: 1,
-                        hoverRadius: 3
-                    },
-                    line: {
-                        borderWidth: 2
-                    }
-                }
-            };
-            
-            temperatureChart = new Chart(tempCtx, {
-                type: 'line',
-                data: {
-                    labels: [],
-                    datasets: [{
-                        label: 'Temperature (°C)',
-                        data: [],
-                        borderColor: '#ff6b6b',
-                        backgroundColor: 'rgba(255, 107, 107, 0.1)',
-                        tension: 0.4
-                    }]
-                },
-                options: chartOptions
-            });
-            
-            powerChart = new Chart(powerCtx, {
-                type: 'line',
-                data: {
-                    labels: [],
-                    datasets: [{
-                        label: 'Power (W)',
-                        data: [],
-                        borderColor: '#4ecdc4',
-                        backgroundColor: 'rgba(78, 205, 196, 0.1)',
-                        tension: 0.4
-                    }]
-                },
-                options: chartOptions
-            });
-        }
-        
-        // Socket event handlers
-        socket.on('connect', function() {
-            updateServerStatus('up', 'Server Online');
-            addToLog('Connected to server');
         });
-        
-        socket.on('disconnect', function() {
-            updateServerStatus('down', 'Server Offline');
-            addToLog('Disconnected from server');
-        });
-        
-        socket.on('connect_error', function() {
-            updateServerStatus('down', 'Connection Error');
-            addToLog('Connection error');
-        });
-        
-        socket.on('reconnect_attempt', function() {
-            updateServerStatus('connecting', 'Reconnecting...');
-        });
-        
-        socket.on('gpu_update', function(data) {
-            updateGPUInfo(data.gpu_info);
-            updateProcessTable(data.processes);
-            updateCharts(data.history);
-            document.getElementById('lastUpdate').textContent = new Date(data.timestamp).toLocaleTimeString();
-            document.getElementById('clientCount').textContent = data.client_count || 0;
+        pendingFrame.gpu = true;
+    }
+    
+    if (data.processes) {
+        processState = data.processes;
+        pendingFrame.processes = true;
+    }
+    
+    if (data.new_samples && data.new_samples.length > 0) {
+        appendSamples(data.new_samples);
+        pendingFrame.history = historyState;
+    }
+    
+    pendingFrame.footer = data;
+    scheduleFrame();
+});
+
+// Every write for a tick (GPU row, process table, charts, footer) lands in one animation frame
+let pendingFrame = { gpu: false, processes: false, history: null, footer: null };
+let frameScheduled = false;
+
+function scheduleFrame() {
+    if (frameScheduled) return;
+    frameScheduled = true;
+    requestAnimationFrame(renderFrame);
+}
+
+function renderFrame() {
+    frameScheduled = false;
+    const frame = pendingFrame;
+    pendingFrame = { gpu: false, processes: false, history: null, footer: null };
+    
+    if (frame.gpu) updateGPUInfo(gpuState);
+    if (frame.processes) updateProcessTable(processState);
+    if (frame.history) drawCharts(frame.history);
+    if (frame.footer) {
+        el.lastUpdate.textContent = new Date(frame.footer.timestamp).toLocaleTimeString();
+        el.clientCount.textContent = frame.footer.client_count || 0;
+    }
+}
+
+// Unsupported readings arrive as 'N/A' (NVML) or '[N/A]' (nvidia-smi) and are shown without units
+function withUnit(value, unit, prefix = '') {
+    return typeof value === 'number' ? `${prefix}${value}${unit}` : String(value);
+}
+
+// GPU status lines and row cells, created once and then patched in place
+let gpuCells = null;
+
+function updateGPUInfo(gpuInfo) {
+    const tbody = el.gpuTbody;
+    
+    if (!gpuInfo || gpuInfo.length === 0) {
+        tbody.replaceChildren();
+        gpuCells = null;
+        return;
+    }
+    
+    const gpu = gpuInfo[0];
+    const values = [
+        `Max Wattage: ${withUnit(gpu.power_limit, 'W')}`,
+        `Temperature: ${withUnit(gpu.temperature, '°C')}`,
+        `Current: ${withUnit(gpu.power_draw, 'W')}`,
+        (gpu.name || '').split(' ').slice(-2).join(' '),  // a partial update may lack the name
+        withUnit(gpu.temperature, '°C'),
+        withUnit(gpu.fan_speed, '%'),
+        withUnit(gpu.power_draw, 'W'),
+        withUnit(gpu.gpu_util, '%'),
+        withUnit(gpu.memory_util, '%'),
+        withUnit(gpu.memory_used, 'MB'),
+        `${gpu.pcie_gen_current}/${gpu.pcie_gen_max}`,
+        `${withUnit(gpu.pcie_width_current, '', 'x')}/${withUnit(gpu.pcie_width_max, '', 'x')}`,
+        `${gpu.pcie_gts_current}/${gpu.pcie_gts_max}`,
+        String(gpu.driver_version),
+        String(gpu.cuda_version)
+    ];
+    
+    if (gpuCells === null) {
+        const row = createRow(new Array(values.length - 3).fill(''));
+        tbody.replaceChildren(row);
+        gpuCells = {
+            nodes: [
+                el.powerLimit,
+                el.temperature,
+                el.power,
+                ...row.cells
+            ],
+            prev: []
+        };
+    }
+    
+    // Only write the cells whose text actually changed
+    values.forEach((value, i) => {
+        if (gpuCells.prev[i] !== value) {
+            gpuCells.nodes[i].textContent = value;
+            gpuCells.prev[i] = value;
+        }
+    });
+}
+
+// Create a <tr> whose cells hold the given values as plain text
+function createRow(values) {
+    const row = document.createElement('tr');
+    values.forEach(value => {
+        const cell = document.createElement('td');
+        cell.textContent = value;
+        row.appendChild(cell);
+    });
+    return row;
+}
+
+function updateProcessTable(processes) {
+    const tbody = el.procTbody;
+    const frag = document.createDocumentFragment();
+    
+    processes.forEach(proc => {
+        frag.appendChild(createRow([proc.name, proc.memory_percent]));
+    });
+    
+    // One mutation replaces the old rows with the new ones
+    tbody.replaceChildren(frag);
+}
+
+// Chart redraws share the tick's frame, so bursts of updates cost at most one redraw per frame
+function updateCharts(history) {
+    pendingFrame.history = history;
+    scheduleFrame();
+}
+
+// seq of the newest sample already plotted; unlike local timestamps it never goes backwards
+let lastChartSeq = 0;
+
+function resetCharts() {
+    [temperatureChart, powerChart].forEach(chart => {
+        chart.start = 0;
+        chart.count = 0;
+    });
+    lastChartSeq = 0;
+}
+
+function drawCharts(history) {
+    if (!history || history.length === 0) return;
+    
+    // Walk back from the end to the first sample not plotted yet
+    let start = history.length;
+    while (start > 0 && history[start - 1].seq > lastChartSeq) start--;
+    if (start === history.length) return;
+    
+    const fresh = history.slice(start);
+    lastChartSeq = fresh[fresh.length - 1].seq;
+    
+    fresh.forEach(h => {
+        pushSparkline(temperatureChart, h.label, h.temperature);
+        pushSparkline(powerChart, h.label, h.power);
+    });
+    drawSparkline(temperatureChart);
+    drawSparkline(powerChart);
+}
+
+// Press feedback comes from the .btn:active scale, which the compositor handles on its own
+function setPowerLimit(wattage) {
+    fetch('/api/set_power', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ wattage: wattage })
+    })
+    .then(response => response.json())
+    .then(data => {
+        addToLog(data.message);
+    })
+    .catch(error => addToLog('Error ' + error));
+}
+
+function updateServerStatus(status, text) {
+    const indicator = el.serverStatus;
+    const statusText = el.serverStatusText;
+    
+    // Remove all status classes
+    indicator.classList.remove('server-up', 'server-down', 'server-connecting');
+    
+    // Add appropriate status class
+    indicator.classList.add('server-' + status);
+    
+    // Update status text
+    statusText.textContent = text;
+}
+
+// Repeated Enter presses or clicks are debounced, and an unchanged value is never re-sent
+let lastSentInterval = null;
+let intervalSendTimer = null;
+
+function setUpdateInterval() {
+    const interval = parseInt(el.intervalInput.value);
+    // Whatever is in the box now supersedes any value still waiting to be sent
+    clearTimeout(intervalSendTimer);
+    if (isNaN(interval) || interval < 100 || interval > 10000) {
+        addToLog('Invalid interval. Must be 100-10000ms');
+        return;
+    }
+    if (interval === lastSentInterval) return;
+    
+    intervalSendTimer = setTimeout(() => {
+        lastSentInterval = interval;
+        fetch('/api/set_update_interval', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ interval: interval })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) lastSentInterval = null;
+            addToLog(data.message);
+        })
+        .catch(error => {
+            lastSentInterval = null;
+            addToLog('Error ' + error);
         });
-        
-        function updateGPUInfo(gpuInfo) {
-            const tbody = document.querySelector('#gpuTable tbody');
-            tbody.innerHTML = '';
-            
-            if (gpuInfo && gpuInfo.length > 0) {
-                const gpu = gpuInfo[0];
-                
-                document.getElementById('currentPowerLimit').textContent = 
-                    `Max Wattage: ${gpu.power_limit}W`;
-                document.getElementById('currentTemperature').textContent = 
-                    `Temperature: ${gpu.temperature}°C`;
-                document.getElementById('currentPower').textContent = 
-                    `Current: ${gpu.power_draw}W`;
-                
-                const row = tbody.insertRow();
-                row.innerHTML = `
-                    <td>${gpu.name.split(' ').slice(-2).join(' ')}</td>
-                    <td>${gpu.temperature}°C</td>
-                    <td>${gpu.fan_speed}%</td>
-                    <td>${gpu.power_draw}W</td>
-                    <td>${gpu.gpu_util}%</td>
-                    <td>${gpu.memory_util}%</td>
-                    <td>${gpu.memory_used}MB</td>
-                    <td>${gpu.pcie_gen_current}/${gpu.pcie_gen_max}</td>
-                    <td>x${gpu.pcie_width_current}/x${gpu.pcie_width_max}</td>
-                    <td>${gpu.pcie_gts_current}/${gpu.pcie_gts_max}</td>
-                    <td>${gpu.driver_version}</td>
-                    <td>${gpu.cuda_version}</td>
-                `;
-            }
-        }
-        
-        function updateProcessTable(processes) {
-            const tbody = document.querySelector('#processTable tbody');
-            tbody.innerHTML = '';
-            
-            processes.forEach(proc => {
-                const row = tbody.insertRow();
-                row.innerHTML = `
-                    <td>${proc.name}</td>
-                    <td>${proc.memory_percent}</td>
-                `;
-            });
-        }
-        
-        function updateCharts(history) {
-            if (!history || history.length === 0) return;
-            
-            const labels = history.map(h => new Date(h.timestamp).toLocaleTimeString().slice(0, 5));
-            const tempData = history.map(h => h.temperature);
-            const powerData = history.map(h => h.power);
-            
-            // Update temperature chart
-            temperatureChart.data.labels = labels;
-            temperatureChart.data.datasets[0].data = tempData;
-            temperatureChart.data.datasets[0].label = `Temp ${tempData[tempData.length-1]}°C`;
-            temperatureChart.update('none');
-            
-            // Update power chart
-            powerChart.data.labels = labels;
-            powerChart.data.datasets[0].data = powerData;
-            powerChart.data.datasets[0].label = `Power ${powerData[powerData.length-1]}W`;
-            powerChart.update('none');
-        }
-        
-        function setPowerLimit(wattage) {
-            // Visual feedback
-            if (event && event.target) {
-                event.target.style.transform = 'scale(0.98)';
-                setTimeout(() => event.target.style.transform = '', 100);
-            }
-            
-            fetch('/api/set_power', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ wattage: wattage })
-            })
-            .then(response => response.json())
-            .then(data => {
-                addToLog(data.message);
-            })
-            .catch(error => addToLog('Error ' + error));
-        }
-        
-        function updateServerStatus(status, text) {
-            const indicator = document.getElementById('serverStatus');
-            const statusText = document.getElementById('serverStatusText');
-            
-            // Remove all status classes
-            indicator.classList.remove('server-up', 'server-down', 'server-connecting');
-            
-            // Add appropriate status class
-            indicator.classList.add('server-' + status);
-            
-            // Update status text
-            statusText.textContent = text;
-        }
-        
-        function setUpdateInterval() {
-            const interval = parseInt(document.getElementById('intervalInput').value);
-            if (interval < 100 || interval > 10000) {
-                addToLog('Invalid interval. Must be 100-10000ms');
-                return;
-            }
-            
-            fetch('/api/set_update_interval', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ interval: interval })
-            })
-            .then(response => response.json())
-            .then(data => {
-                addToLog(data.message);
-            })
-            .catch(error => addToLog('Error ' + error));
-        }
-        
-        function addToLog(message) {
-            const log = document.getElementById('powerLog');
-            const timestamp = new Date().toLocaleTimeString().slice(0, 5);
-            log.innerHTML += `${timestamp} - ${message}<br>`;
-            log.scrollTop = log.scrollHeight;
+    }, 250);
+}
+
+function addToLog(message) {
+    const log = el.log;
+    // Plain HH:MM without going through the locale formatter
+    const now = new Date();
+    const timestamp = String(now.getHours()).padStart(2, '0') + ':' + String(now.getMinutes()).padStart(2, '0');
+    
+    // One node per entry, and only the newest MAX_LOG_LINES are kept
+    const line = document.createElement('div');
+    line.textContent = `${timestamp} - ${message}`;
+    log.appendChild(line);
+    while (log.childElementCount > MAX_LOG_LINES) {
+        log.removeChild(log.firstChild);
+    }
+    log.scrollTop = log.scrollHeight;
+}
+
+function sortTable(columnIndex) {
+    const tbody = el.procTbody;
+    const rows = Array.from(tbody.rows);
+    
+    const isAscending = sortDirection[columnIndex] !== true;
+    sortDirection[columnIndex] = isAscending;
+    
+    // Read and parse each cell once up front instead of in every comparison
+    const decorated = rows.map(row => {
+        const text = row.cells[columnIndex].textContent;
+        return { row: row, text: text, num: parseFloat(text) };
+    });
+    
+    decorated.sort((a, b) => {
+        if (!isNaN(a.num) && !isNaN(b.num)) {
+            return isAscending ? a.num - b.num : b.num - a.num;
+        } else {
+            return isAscending ? a.text.localeCompare(b.text) : b.text.localeCompare(a.text);
         }
-        
-        function sortTable(columnIndex) {
-            const table = document.getElementById('processTable');
-            const tbody = table.getElementsByTagName('tbody')[0];
-            const rows = Array.from(tbody.rows);
-            
-            const isAscending = sortDirection[columnIndex] !== true;
-            sortDirection[columnIndex] = isAscending;
-            
-            rows.sort((a, b) => {
-                const aVal = a.cells[columnIndex].textContent;
-                const bVal = b.cells[columnIndex].textContent;
-                
-                const aNum = parseFloat(aVal);
-                const bNum = parseFloat(bVal);
-                
-                if (!isNaN(aNum) && !isNaN(bNum)) {
-                    return isAscending ? aNum - bNum : bNum - aNum;
-                } else {
-                    return isAscending ? aVal.localeCompare(bVal) : bVal.localeCompare(aVal);
-                }
-            });
-            
-            tbody.innerHTML = '';
-            rows.forEach(row => tbody.appendChild(row));
+    });
+    
+    // Reorder all rows in a single mutation
+    tbody.replaceChildren(...decorated.map(d => d.row));
+}
+
+// Initialize when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    el = {
+        powerLimit: document.getElementById('currentPowerLimit'),
+        temperature: document.getElementById('currentTemperature'),
+        power: document.getElementById('currentPower'),
+        lastUpdate: document.getElementById('lastUpdate'),
+        clientCount: document.getElementById('clientCount'),
+        log: document.getElementById('powerLog'),
+        intervalInput: document.getElementById('intervalInput'),
+        serverStatus: document.getElementById('serverStatus'),
+        serverStatusText: document.getElementById('serverStatusText'),
+        gpuTbody: document.querySelector('#gpuTable tbody'),
+        procTbody: document.querySelector('#processTable tbody')
+    };
+    
+    // Set initial server status
+    updateServerStatus('connecting', 'Connecting...');
+    
+    initCharts();
+    observeChartResizes();
+    addToLog('Interface ready');
+    
+    // Add Enter key support for interval input
+    el.intervalInput.addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            setUpdateInterval();
         }
-        
-        // Initialize when page loads
-        document.addEventListener('DOMContentLoaded', function() {
-            // Set initial server status
-            updateServerStatus('connecting', 'Connecting...');
-            
-            initCharts();
-            addToLog('Interface ready');
-            
-            // Add Enter key support for interval input
-            document.getElementById('intervalInput').addEventListener('keypress', function(e) {
-                if (e.key === 'Enter') {
-                    setUpdateInterval();
-                }
+    });
+    
+    // One delegated listener per group instead of an inline handler on every button
+    document.querySelector('.power-buttons').addEventListener('click', function(e) {
+        const button = e.target.closest('[data-wattage]');
+        if (button) setPowerLimit(Number(button.dataset.wattage));
+    });
+    document.querySelector('#processTable thead').addEventListener('click', function(e) {
+        const header = e.target.closest('[data-col]');
+        if (header) sortTable(Number(header.dataset.col));
+    });
+    document.getElementById('intervalButton').addEventListener('click', setUpdateInterval);
+    
+    // An empty passive touchstart listener keeps :active feedback working on iOS
+    document.addEventListener('touchstart', function() {}, { passive: true });
+});
+
+// Container sizes come from the observer entries (no layout queries); the canvases are
+// resized together in the next frame, at most once per frame
+let resizeFrameScheduled = false;
+
+function observeChartResizes() {
+    const charts = [temperatureChart, powerChart];
+    const observer = new ResizeObserver(entries => {
+        entries.forEach(entry => {
+            const chart = charts.find(c => c.canvas.parentElement === entry.target);
+            if (chart) chart.pendingSize = entry.contentRect;
+        });
+        if (resizeFrameScheduled) return;
+        resizeFrameScheduled = true;
+        requestAnimationFrame(() => {
+            resizeFrameScheduled = false;
+            charts.forEach(chart => {
+                if (!chart.pendingSize) return;
+                resizeSparkline(chart, chart.pendingSize.width, chart.pendingSize.height);
+                chart.pendingSize = null;
             });
         });
-        
-        // Handle resize and orientation changes
-        function handleResize() {
-            setTimeout(() => {
-                if (temperatureChart) temperatureChart.resize();
-                if (powerChart) powerChart.resize();
-            }, 300);
-        }
-        
-        window.addEventListener('resize', handleResize);
-        window.addEventListener('orientationchange', handleResize);
-    </script>
-</body>
-</html>
+    });
+    observer.observe(document.getElementById('temperatureChart').parentElement);
+    observer.observe(document.getElementById('powerChart').parentElement);
+}
 '''
 
+# Changes whenever the assets do, so browsers can cache them for a long time
+ASSET_VERSION = hashlib.md5((DASHBOARD_CSS + DASHBOARD_JS).encode()).hexdigest()[:8]
+
+def minify_text(text, line_comment=None):
+    """Strip indentation, blank lines, block comments and (optionally) whole-line comments from a static asset"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line and not (line_comment and line.startswith(line_comment)))
+
+def precompile_asset(text, mimetype, max_age):
+    """Encode a static asset once, with a gzipped copy for clients that accept it"""
+    body = text.encode('utf-8')
+    return {
+        'body': body,
+        'gzip': gzip.compress(body, compresslevel=9),
+        'mimetype': mimetype,
+        'cache_control': f'public, max-age={max_age}'
+    }
+
+def asset_response(asset):
+    """Serve a precompiled asset, gzipped when the request allows it"""
+    headers = {'Cache-Control': asset['cache_control'], 'Vary': 'Accept-Encoding'}
+    if request.accept_encodings['gzip']:
+        headers['Content-Encoding'] = 'gzip'
+        return Response(asset['gzip'], mimetype=asset['mimetype'], headers=headers)
+    return Response(asset['body'], mimetype=asset['mimetype'], headers=headers)
+
+# Minified and compressed once at startup; requests just hand out the prepared bytes
+INDEX_ASSET = precompile_asset(minify_text(HTML_TEMPLATE.replace('{{ asset_version }}', ASSET_VERSION)), 'text/html', 300)
+CSS_ASSET = precompile_asset(minify_text(DASHBOARD_CSS), 'text/css', 86400)
+JS_ASSET = precompile_asset(minify_text(DASHBOARD_JS, '//'), 'application/javascript', 86400)
+
 def main():
     # Check if nvidia-smi is available
     try: